@@ -7,6 +7,9 @@ from typing import Any, Dict, List
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class Settings:
@@ -49,6 +52,12 @@ def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any
     return result
 
 
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file; raises FileNotFoundError like open() so callers keep their fallbacks."""
+    with path.open("r") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
 def load_settings(config_path: Path) -> Settings:
     """Load settings from layered config: base + user overrides."""
     config_dir = config_path.parent
@@ -57,13 +66,11 @@ def load_settings(config_path: Path) -> Settings:
     
     # Load base configuration (required)
     try:
-        with base_config_path.open("r") as f:
-            base_data = yaml.safe_load(f)
+        base_data = _load_yaml(base_config_path)
     except FileNotFoundError:
         # Fallback to legacy single config file for backwards compatibility
         try:
-            with config_path.open("r") as f:
-                data = yaml.safe_load(f)
+            data = _load_yaml(config_path)
         except FileNotFoundError:
             print(f"FATAL: missing config at {config_path} or {base_config_path}", file=sys.stderr)
             raise SystemExit(1)
@@ -75,14 +82,15 @@ def load_settings(config_path: Path) -> Settings:
         raise SystemExit(1)
     else:
         # Load user overrides (optional)
+        # (opening the file doubles as the existence check)
         user_data = {}
-        if user_config_path.exists():
-            try:
-                with user_config_path.open("r") as f:
-                    user_data = yaml.safe_load(f) or {}
-                print(f"Loaded user config overrides from {user_config_path}", file=sys.stderr)
-            except Exception as e:
-                print(f"WARNING: invalid user config at {user_config_path}: {e}", file=sys.stderr)
+        try:
+            user_data = _load_yaml(user_config_path) or {}
+            print(f"Loaded user config overrides from {user_config_path}", file=sys.stderr)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"WARNING: invalid user config at {user_config_path}: {e}", file=sys.stderr)
         
         # Merge base + user configs
         data = _deep_merge(base_data, user_data)
@@ -1,29 +1,58 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict
+import os
 import sys
 
 
-# Resolve repository root from this file location
-REPO_ROOT = Path(__file__).resolve().parents[3]
+# Repository root from this file location; abspath is pure string work,
+# unlike resolve() which lstat()s every path component
+REPO_ROOT = Path(os.path.abspath(__file__)).parents[3]
 
 # Use the current frontend structure
-FRONTEND_TEMPLATES = REPO_ROOT / "frontend" / "app" / "templates"
-FRONTEND_CONFIG_BASE = REPO_ROOT / "frontend" / "app" / "config.base.yaml"
-FRONTEND_CONFIG_YAML = REPO_ROOT / "frontend" / "app" / "config.yaml"
-FRONTEND_CONFIG_CI_YAML = REPO_ROOT / "frontend" / "app" / "config.ci.yaml"
-FRONTEND_STATIC = REPO_ROOT / "frontend" / "app" / "static"
+FRONTEND_APP = REPO_ROOT / "frontend" / "app"
+FRONTEND_TEMPLATES = FRONTEND_APP / "templates"
+FRONTEND_CONFIG_BASE = FRONTEND_APP / "config.base.yaml"
+FRONTEND_CONFIG_YAML = FRONTEND_APP / "config.yaml"
+FRONTEND_CONFIG_CI_YAML = FRONTEND_APP / "config.ci.yaml"
+FRONTEND_STATIC = FRONTEND_APP / "static"
+
+
+@lru_cache(maxsize=None)
+def _app_entries() -> Dict[str, bool]:
+    """Map frontend/app entry names to is_dir from a single directory read."""
+    try:
+        with os.scandir(FRONTEND_APP) as it:
+            return {e.name: e.is_dir() for e in it}
+    except FileNotFoundError:
+        return {}
+
+
+@lru_cache(maxsize=None)
+def _exists(path: Path) -> bool:
+    """Check each layout path once per process; the layout is fixed at startup."""
+    if path.parent == FRONTEND_APP:
+        return path.name in _app_entries()
+    return path.exists()
+
+
+def _is_dir(path: Path) -> bool:
+    if path.parent == FRONTEND_APP:
+        return _app_entries().get(path.name, False)
+    return path.is_dir()
 
 
 def assert_legacy_layout() -> None:
     """Fail fast if expected legacy layout is not found."""
     missing = []
-    if not FRONTEND_TEMPLATES.exists():
+    if not _is_dir(FRONTEND_TEMPLATES):
         missing.append(str(FRONTEND_TEMPLATES))
-    if not FRONTEND_STATIC.exists():
+    if not _is_dir(FRONTEND_STATIC):
         missing.append(str(FRONTEND_STATIC))
     # For config, require base config or fallback to legacy configs
-    if not FRONTEND_CONFIG_BASE.exists() and not FRONTEND_CONFIG_YAML.exists() and not FRONTEND_CONFIG_CI_YAML.exists():
+    if not _exists(FRONTEND_CONFIG_BASE) and not _exists(FRONTEND_CONFIG_YAML) and not _exists(FRONTEND_CONFIG_CI_YAML):
         missing.append(f"{FRONTEND_CONFIG_BASE} or {FRONTEND_CONFIG_YAML} or {FRONTEND_CONFIG_CI_YAML}")
     if missing:
         msg = "FATAL: missing required frontend paths: " + ", ".join(missing)
@@ -34,11 +63,11 @@ def assert_legacy_layout() -> None:
 def get_config_path() -> Path:
     """Get the appropriate config file path for the layered config system."""
     # For layered config system, pass any valid config path - the loader will handle base+user
-    if FRONTEND_CONFIG_BASE.exists():
+    if _exists(FRONTEND_CONFIG_BASE):
         return FRONTEND_CONFIG_BASE  # New layered system
-    elif FRONTEND_CONFIG_YAML.exists():
+    elif _exists(FRONTEND_CONFIG_YAML):
         return FRONTEND_CONFIG_YAML  # Legacy single file
-    elif FRONTEND_CONFIG_CI_YAML.exists():
+    elif _exists(FRONTEND_CONFIG_CI_YAML):
         return FRONTEND_CONFIG_CI_YAML  # CI fallback
     else:
         raise SystemExit(f"FATAL: no config file found")
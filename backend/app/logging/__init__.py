@@ -1,17 +1,35 @@
 """BLAST Logging System - Comprehensive logging for rocket sensor monitoring"""
 
-from .logger_manager import LoggerManager
-from .event_logger import EventLogger
-from .serial_logger import SerialLogger
-from .performance_monitor import PerformanceMonitor
-from .error_recovery import ErrorRecovery
-from .freeze_detector import FreezeDetector
+from importlib import import_module
+
+# Public name -> submodule; each submodule is imported on first attribute access
+_SUBMODULES = {
+    'LoggerManager': 'logger_manager',
+    'EventLogger': 'event_logger',
+    'SerialLogger': 'serial_logger',
+    'PerformanceMonitor': 'performance_monitor',
+    'ErrorRecovery': 'error_recovery',
+    'FreezeDetector': 'freeze_detector',
+}
 
 __all__ = [
     'LoggerManager',
-    'EventLogger', 
+    'EventLogger',
     'SerialLogger',
     'PerformanceMonitor',
     'ErrorRecovery',
     'FreezeDetector'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,9 +2,11 @@
 BLAST Event Logger - Application lifecycle and state change logging
 """
 
+import array
 import logging
 import time
-from typing import Dict, Any, Optional
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, Optional
 from enum import Enum
 
 
@@ -22,19 +24,61 @@ class EventType(Enum):
     PERFORMANCE_ALERT = "performance_alert"
 
 
+# Console prefix per event type, e.g. "SENSOR_ALERT"
+_UPPER_NAMES = {event_type: event_type.value.upper() for event_type in EventType}
+
+# Slot of each event type in EventLogger's counter array
+_EVENT_INDEX = {event_type: i for i, event_type in enumerate(EventType)}
+_VALUE_INDEX = {event_type.value: i for event_type, i in _EVENT_INDEX.items()}
+
+
+class _EventCountsView(Mapping):
+    """Live read-only {event type value: count} view over the counter array"""
+    
+    __slots__ = ('_counts',)
+    
+    def __init__(self, counts: array.array):
+        self._counts = counts
+    
+    def __getitem__(self, key: str) -> int:
+        return self._counts[_VALUE_INDEX[key]]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_VALUE_INDEX)
+    
+    def __len__(self) -> int:
+        return len(_VALUE_INDEX)
+
+
 class EventLogger:
     """Handles application lifecycle and state change events"""
     
+    # Python logging level per event type; anything not listed logs at DEBUG
+    _LEVEL_MAP: Dict[EventType, int] = {
+        EventType.SHUTDOWN: logging.WARNING,
+        EventType.SENSOR_ALERT: logging.WARNING,
+        EventType.ERROR_RECOVERY: logging.WARNING,
+        EventType.DATA_SOURCE_CHANGE: logging.INFO,
+        EventType.CONNECTION_STATE: logging.INFO,
+        EventType.PERFORMANCE_ALERT: logging.INFO,
+    }
+    
     def __init__(self, logger_manager):
         self.logger_manager = logger_manager
         self.logger = logging.getLogger('blast.events')
         self.session_id = int(time.time())
         
-        # Track event counts by type
-        self.event_counts = {event_type.value: 0 for event_type in EventType}
+        # Track event counts by type, one unsigned slot per EventType
+        self._event_counts = array.array('Q', [0] * len(EventType))
+        self._counts_view = _EventCountsView(self._event_counts)
         
         self.log_startup()
     
+    @property
+    def event_counts(self) -> Mapping:
+        """Read-only live view of event counts keyed by event type value"""
+        return self._counts_view
+    
     def log_startup(self):
         """Log application startup"""
         self._log_event(
@@ -57,7 +101,7 @@ class EventLogger:
                 'session_id': self.session_id,
                 'uptime_seconds': uptime,
                 'uptime_formatted': f"{uptime/3600:.1f}h",
-                'event_summary': dict(self.event_counts)
+                'event_summary': dict(self._counts_view)
             }
         )
     
@@ -164,36 +208,35 @@ class EventLogger:
     
     def _log_event(self, event_type: EventType, message: str, data: Dict[str, Any]):
         """Internal method to log events"""
-        self.event_counts[event_type.value] += 1
-        
-        # Add session tracking
-        data['session_id'] = self.session_id
-        data['event_sequence'] = self.event_counts[event_type.value]
+        counts = self._event_counts
+        idx = _EVENT_INDEX[event_type]
+        counts[idx] += 1
+        sequence = counts[idx]
         
-        # Log to manager
-        self.logger_manager.log_event(event_type.value, message, data)
+        # Log to manager with session tracking alongside, not inside, the event data
+        self.logger_manager.log_event(event_type.value, message, data,
+                                      session_id=self.session_id, sequence=sequence)
         
-        # Also log to Python logger for console/file output
+        # Also log to Python logger for console/file output; most types log at
+        # DEBUG, which is usually disabled, so skip the call entirely then. The
+        # record carries the structured event so a JSON formatter needs no reparse.
         level = self._get_log_level(event_type)
-        self.logger.log(level, f"[{event_type.value.upper()}] {message}")
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, "[%s] %s", _UPPER_NAMES[event_type], message,
+                            extra={'event_type': event_type.value, 'event_data': data,
+                                   'session_id': self.session_id, 'event_sequence': sequence})
     
     def _get_log_level(self, event_type: EventType) -> int:
         """Map event types to Python logging levels"""
-        critical_events = [EventType.SHUTDOWN, EventType.SENSOR_ALERT, EventType.ERROR_RECOVERY]
-        warning_events = [EventType.DATA_SOURCE_CHANGE, EventType.CONNECTION_STATE, EventType.PERFORMANCE_ALERT]
-        
-        if event_type in critical_events:
-            return logging.WARNING
-        elif event_type in warning_events:
-            return logging.INFO
-        else:
-            return logging.DEBUG
+        return self._LEVEL_MAP.get(event_type, logging.DEBUG)
     
     def get_event_summary(self) -> Dict[str, Any]:
         """Get summary of events logged in this session"""
+        # One snapshot, so the counts and their total agree and the result serializes
+        counts = dict(self._counts_view)
         return {
             'session_id': self.session_id,
             'session_duration': time.time() - self.session_id,
-            'event_counts': dict(self.event_counts),
-            'total_events': sum(self.event_counts.values())
+            'event_counts': counts,
+            'total_events': sum(counts.values())
         }
\ No newline at end of file
@@ -2,38 +2,61 @@
 BLAST Freeze Detector - Detects system freezes and unresponsive states
 """
 
+import bisect
 import logging
 import time
 import threading
 import asyncio
-from typing import Dict, Any, Optional, Callable, List
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, Callable, List, Tuple
 from collections import deque
+from functools import partial
 
 
-@dataclass
 class WatchdogTimer:
     """Individual watchdog timer for monitoring specific components"""
-    name: str
-    timeout_seconds: float
-    last_heartbeat: float
-    callback: Optional[Callable] = None
-    active: bool = True
+    
+    # Slots: heartbeat() and the watchdog scan touch these on every call
+    __slots__ = ('name', 'timeout_seconds', 'last_heartbeat', 'callback', 'active')
+    
+    # Threading: last_heartbeat is written by heartbeat() on the event loop
+    # and worker threads and read by the monitor thread, without a lock. In
+    # CPython storing a float attribute swaps one object reference under the
+    # GIL, so a reader sees the old or the new value, never a torn one; the
+    # worst race is a scan that misses a heartbeat landing in the same
+    # instant, which only delays the next check by one interval.
+    
+    def __init__(self, name: str, timeout_seconds: float, last_heartbeat: float,
+                 callback: Optional[Callable] = None, active: bool = True):
+        self.name = name
+        self.timeout_seconds = timeout_seconds
+        self.last_heartbeat = last_heartbeat
+        self.callback = callback
+        self.active = active
+    
+    def __repr__(self) -> str:
+        return (f"WatchdogTimer(name={self.name!r}, timeout_seconds={self.timeout_seconds!r}, "
+                f"last_heartbeat={self.last_heartbeat!r}, active={self.active!r})")
 
 
 class FreezeDetector:
     """Detects system freezes and unresponsive components"""
     
-    def __init__(self, logger_manager):
+    def __init__(self, logger_manager, autostart: bool = True):
         self.logger_manager = logger_manager
         self.logger = logging.getLogger('blast.freeze_detector')
         
         # Watchdog timers for different components
         self.watchdogs: Dict[str, WatchdogTimer] = {}
+        self._active_watchdogs = 0
         
         # Detection history
         self.freeze_events = deque(maxlen=50)
-        self.heartbeat_history = deque(maxlen=1000)
+        # Heartbeats per wall-clock second over the last 300 s: slot sec % 300
+        # holds the count for second _hb_secs[slot], so stale slots are skipped
+        self._hb_counts = [0] * 300
+        self._hb_secs = [-1] * 300
+        # Freeze event timestamps in append (time) order, for bisecting windows
+        self._freeze_ts: deque = deque(maxlen=50)
         
         # Statistics
         self.stats = {
@@ -44,20 +67,42 @@ class FreezeDetector:
             'monitoring_start': time.time()
         }
         
+        # Per-thread heartbeat counters, summed by get_stats()
+        self._hb_local = threading.local()
+        self._hb_slots: List[List[int]] = []
+        self._hb_slots_lock = threading.Lock()
+        
         # Monitoring state
         self._monitoring = False
         self._monitor_thread = None
+        # Wakes the monitor loop early: on stop, or when the watchdog set changes
+        self._wake_event = threading.Event()
+        self._max_check_interval = 60.0
+        
+        # Repeat-alert backoff for components that stay frozen: the next time
+        # each may alert again, and the delay that was applied (doubling to a cap)
+        self._next_alert: Dict[str, float] = {}
+        self._alert_delay: Dict[str, float] = {}
+        self._max_alert_delay = 300.0
         self._freeze_callbacks = []
         
+        # get_stats()/health_check() results are reused for _stats_ttl seconds
+        # so endpoint polling doesn't rescan the history deques on every call
+        self._stats_ttl = 1.0
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
         # System responsiveness tracking
         self.last_system_heartbeat = time.time()
-        self.system_response_times = deque(maxlen=100)
+        # Last 100 response times, in seconds, as floats
+        self.system_response_times: deque = deque(maxlen=100)
         
         # Setup default watchdogs
         self._setup_default_watchdogs()
         
-        # Start monitoring
-        self.start_monitoring()
+        # Start monitoring (the app defers this to its startup hook)
+        if autostart:
+            self.start_monitoring()
     
     def _setup_default_watchdogs(self):
         """Setup default watchdog timers for critical components"""
@@ -92,6 +137,9 @@ class FreezeDetector:
     
     def register_watchdog(self, name: str, timeout_seconds: float, callback: Optional[Callable] = None):
         """Register a new watchdog timer"""
+        previous = self.watchdogs.get(name)
+        if previous is None or not previous.active:
+            self._active_watchdogs += 1
         self.watchdogs[name] = WatchdogTimer(
             name=name,
             timeout_seconds=timeout_seconds,
@@ -100,28 +148,81 @@ class FreezeDetector:
             active=True
         )
         
+        self._wake_event.set()  # Recompute the monitor's next deadline
+        
         self.logger.info(f"Registered watchdog '{name}' with {timeout_seconds}s timeout")
     
+    def set_watchdog_active(self, name: str, active: bool):
+        """Enable or disable an existing watchdog"""
+        watchdog = self.watchdogs[name]
+        if watchdog.active != active:
+            watchdog.active = active
+            self._active_watchdogs += 1 if active else -1
+            self._wake_event.set()
+    
     def heartbeat(self, component: str):
         """Send heartbeat for a component"""
-        if component in self.watchdogs:
-            self.watchdogs[component].last_heartbeat = time.time()
-            self.stats['total_heartbeats'] += 1
-            
-            # Record heartbeat
-            self.heartbeat_history.append({
-                'timestamp': time.time(),
-                'component': component
-            })
-            
-            # Update system heartbeat
-            if component == 'system_health':
-                self.last_system_heartbeat = time.time()
+        watchdog = self.watchdogs.get(component)
+        if watchdog is not None:
+            self._beat(watchdog)
+    
+    def heartbeater(self, component: str) -> Callable[[], None]:
+        """Return a no-argument heartbeat for one component, for hot loops
+
+        The watchdog is looked up once here; the callable keeps feeding that
+        timer, so fetch a new one if the component is registered again.
+        """
+        watchdog = self.watchdogs.get(component)
+        if watchdog is None:
+            return lambda: None
+        return partial(self._beat, watchdog)
+    
+    def _beat(self, watchdog: WatchdogTimer):
+        """Record a heartbeat on a known watchdog"""
+        now = time.time()
+        watchdog.last_heartbeat = now
+        self._heartbeat_slot()[0] += 1
+        
+        # Record heartbeat in its one-second bucket
+        sec = int(now)
+        bucket = sec % 300
+        if self._hb_secs[bucket] != sec:
+            self._hb_secs[bucket] = sec
+            self._hb_counts[bucket] = 0
+        self._hb_counts[bucket] += 1
+        
+        component = watchdog.name
+        # Update system heartbeat
+        if component == 'system_health':
+            self.last_system_heartbeat = now
+        
+        # A heartbeat means the component recovered; its next freeze alerts at once
+        if self._next_alert and self._next_alert.pop(component, None) is not None:
+            self._alert_delay.pop(component, None)
+            self._wake_event.set()  # The monitor may be sleeping out the backoff
+    
+    def _heartbeat_slot(self) -> List[int]:
+        """Return this thread's heartbeat counter, registering it on first use"""
+        slot = getattr(self._hb_local, 'slot', None)
+        if slot is None:
+            slot = [0]
+            with self._hb_slots_lock:
+                self._hb_slots.append(slot)
+            self._hb_local.slot = slot
+        return slot
     
     def start_monitoring(self):
         """Start freeze detection monitoring"""
         if not self._monitoring:
+            # Time before monitoring starts is not a freeze
+            now = time.time()
+            for watchdog in self.watchdogs.values():
+                watchdog.last_heartbeat = now
+            self._next_alert.clear()
+            self._alert_delay.clear()
             self._monitoring = True
+            self._wake_event.clear()
+            self._health_cache = None
             self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self._monitor_thread.start()
             self.logger.info("Freeze detection monitoring started")
@@ -129,46 +230,71 @@ class FreezeDetector:
     def stop_monitoring(self):
         """Stop freeze detection monitoring"""
         self._monitoring = False
+        self._wake_event.set()
+        self._health_cache = None
         if self._monitor_thread:
             self._monitor_thread.join(timeout=5.0)
         self.logger.info("Freeze detection monitoring stopped")
     
     def _monitor_loop(self):
-        """Main monitoring loop to check for freezes"""
+        """Main monitoring loop to check for freezes
+
+        Runs on its own thread on purpose: most heartbeats come from the
+        event loop, and a watchdog scheduled on that loop would stall along
+        with it and never see the freeze it exists to report.
+        """
         while self._monitoring:
             try:
-                self._check_all_watchdogs()
-                time.sleep(5)  # Check every 5 seconds
+                # Clear before checking so a wake-up that lands during the check
+                # survives, then sleep until the earliest watchdog could expire
+                self._wake_event.clear()
+                self._wake_event.wait(max(0.05, self._check_all_watchdogs()))
             except Exception as e:
                 self.logger.error(f"Error in freeze detection monitoring: {e}")
-                time.sleep(10)  # Wait longer on error
+                self._wake_event.wait(10)  # Wait longer on error
     
-    def _check_all_watchdogs(self):
-        """Check all watchdog timers for timeouts"""
+    def _check_all_watchdogs(self) -> float:
+        """Check all watchdog timers for timeouts; return seconds until the next could expire"""
         current_time = time.time()
+        next_due = self._max_check_interval
         
-        for name, watchdog in self.watchdogs.items():
+        for watchdog in self.watchdogs.values():
             if not watchdog.active:
                 continue
                 
             time_since_heartbeat = current_time - watchdog.last_heartbeat
             
             if time_since_heartbeat > watchdog.timeout_seconds:
-                self._handle_freeze_detected(name, time_since_heartbeat, watchdog)
+                # Still frozen after an alert: stay quiet until the backoff expires
+                next_alert = self._next_alert.get(watchdog.name, 0.0)
+                if current_time >= next_alert:
+                    next_alert = self._handle_freeze_detected(watchdog.name, time_since_heartbeat, watchdog)
+                remaining = next_alert - current_time
+            else:
+                remaining = watchdog.timeout_seconds - time_since_heartbeat
+                # A heartbeat that raced the last alert can leave its backoff behind
+                if self._next_alert and self._next_alert.pop(watchdog.name, None) is not None:
+                    self._alert_delay.pop(watchdog.name, None)
+            if remaining < next_due:
+                next_due = remaining
+        
+        return next_due
     
-    def _handle_freeze_detected(self, component: str, freeze_duration: float, watchdog: WatchdogTimer):
-        """Handle detected freeze"""
+    def _handle_freeze_detected(self, component: str, freeze_duration: float, watchdog: WatchdogTimer) -> float:
+        """Handle detected freeze; return when the next alert for it is due"""
         self.stats['freezes_detected'] += 1
         self.stats['missed_heartbeats'] += 1
         
+        now = time.time()
         freeze_event = {
-            'timestamp': time.time(),
+            'timestamp': now,
             'component': component,
             'freeze_duration': freeze_duration,
             'timeout_threshold': watchdog.timeout_seconds
         }
         
         self.freeze_events.append(freeze_event)
+        self._freeze_ts.append(now)
         
         # Log freeze detection
         self.logger.warning(f"FREEZE DETECTED: {component} unresponsive for {freeze_duration:.1f}s")
@@ -205,8 +331,12 @@ class FreezeDetector:
             except Exception as e:
                 self.logger.error(f"Freeze notification callback failed: {e}")
         
-        # Reset heartbeat timer to avoid repeated alerts
-        watchdog.last_heartbeat = time.time()
+        # Back off repeat alerts while the component stays frozen: the first
+        # repeat comes after twice the timeout, then the gap keeps doubling
+        delay = min(self._alert_delay.get(component, watchdog.timeout_seconds) * 2, self._max_alert_delay)
+        self._alert_delay[component] = delay
+        next_alert = self._next_alert[component] = now + delay
+        return next_alert
     
     def register_freeze_callback(self, callback: Callable):
         """Register a callback to be called when freeze is detected"""
@@ -218,11 +348,7 @@ class FreezeDetector:
     
     def log_response_time(self, operation: str, response_time: float):
         """Log system response time"""
-        self.system_response_times.append({
-            'timestamp': time.time(),
-            'operation': operation,
-            'response_time': response_time
-        })
+        self.system_response_times.append(response_time)
         
         # Check for slow responses that might indicate freezing
         slow_threshold = 5.0  # seconds
@@ -236,6 +362,16 @@ class FreezeDetector:
                 {'threshold': slow_threshold}
             )
     
+    def response_time_percentile(self, p: float) -> Optional[float]:
+        """p-th percentile (0-100) of recent response times, linearly interpolated"""
+        times = sorted(self.system_response_times)
+        if not times:
+            return None
+        rank = (len(times) - 1) * min(max(p, 0.0), 100.0) / 100.0
+        low = int(rank)
+        high = min(low + 1, len(times) - 1)
+        return times[low] + (times[high] - times[low]) * (rank - low)
+    
     # Default freeze handlers
     
     def _handle_data_acquisition_freeze(self, component: str, freeze_duration: float):
@@ -276,21 +412,23 @@ class FreezeDetector:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive freeze detection statistics"""
+        cached = self._stats_cache
+        if cached is not None and time.monotonic() - cached[0] < self._stats_ttl:
+            return self._copy_stats(cached[1])
         current_time = time.time()
         uptime = current_time - self.stats['monitoring_start']
+        self.stats['total_heartbeats'] = sum(slot[0] for slot in self._hb_slots)
         
         # Calculate recent activity
-        recent_heartbeats = len([h for h in self.heartbeat_history 
-                               if current_time - h['timestamp'] < 300])  # Last 5 minutes
-        
-        recent_freezes = len([f for f in self.freeze_events 
-                            if current_time - f['timestamp'] < 3600])  # Last hour
+        oldest = int(current_time) - 300  # Last 5 minutes
+        recent_heartbeats = sum(count for sec, count in zip(self._hb_secs, self._hb_counts) if sec > oldest)
+        recent_freezes = self._count_since(self._freeze_ts, current_time - 3600)  # Last hour
         
-        return {
+        stats = {
             **self.stats,
             'uptime_seconds': uptime,
             'uptime_formatted': f"{uptime/3600:.1f}h",
-            'active_watchdogs': len([w for w in self.watchdogs.values() if w.active]),
+            'active_watchdogs': self._active_watchdogs,
             'total_watchdogs': len(self.watchdogs),
             'recent_heartbeats_5min': recent_heartbeats,
             'recent_freezes_1hour': recent_freezes,
@@ -306,6 +444,18 @@ class FreezeDetector:
                 for name, wd in self.watchdogs.items()
             }
         }
+        self._stats_cache = (time.monotonic(), stats)
+        return self._copy_stats(stats)
+    
+    @staticmethod
+    def _copy_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of cached stats, containers included, so callers can't alter the cache"""
+        return {**stats, 'watchdog_status': {name: dict(status) for name, status in stats['watchdog_status'].items()}}
+    
+    @staticmethod
+    def _count_since(timestamps: deque, cutoff: float) -> int:
+        """Number of timestamps newer than cutoff, by binary search over the ordered deque"""
+        return len(timestamps) - bisect.bisect_right(timestamps, cutoff)
     
     def get_recent_events(self, limit: int = 20) -> List[Dict]:
         """Get recent freeze events"""
@@ -313,6 +463,9 @@ class FreezeDetector:
     
     def health_check(self) -> Dict[str, Any]:
         """Get freeze detector health status"""
+        cached = self._health_cache
+        if cached is not None and time.monotonic() - cached[0] < self._stats_ttl:
+            return {**cached[1], 'triggered_watchdogs': list(cached[1]['triggered_watchdogs'])}
         current_time = time.time()
         
         # Check if any watchdogs are currently triggered
@@ -322,8 +475,7 @@ class FreezeDetector:
                 triggered_watchdogs.append(name)
         
         # Check recent freeze rate
-        recent_freezes = len([f for f in self.freeze_events 
-                            if current_time - f['timestamp'] < 3600])  # Last hour
+        recent_freezes = self._count_since(self._freeze_ts, current_time - 3600)  # Last hour
         
         healthy = (
             len(triggered_watchdogs) == 0 and
@@ -331,14 +483,16 @@ class FreezeDetector:
             self._monitoring
         )
         
-        return {
+        health = {
             'healthy': healthy,
             'status': 'healthy' if healthy else 'degraded',
             'monitoring_active': self._monitoring,
             'triggered_watchdogs': triggered_watchdogs,
             'recent_freezes_count': recent_freezes,
-            'active_watchdogs': len([w for w in self.watchdogs.values() if w.active])
+            'active_watchdogs': self._active_watchdogs
         }
+        self._health_cache = (time.monotonic(), health)
+        return {**health, 'triggered_watchdogs': list(triggered_watchdogs)}
 
 
 class ResponseTimer:
@@ -2,21 +2,95 @@
 BLAST Logger Manager - Central coordination for all logging activities
 """
 
+import atexit
 import logging
 import logging.config
+import logging.handlers
 import json
 import time
 import csv
+import io
+import itertools
 import os
+import queue
+import threading
+import weakref
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 from datetime import datetime
 
+try:
+    import orjson  # C encoder for the JSONL hot path
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+_ORJSON_OPTS = (orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
+def _jsonl(entry: Any) -> bytes:
+    """Encode one JSONL record, newline included"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=_ORJSON_OPTS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder copes
+    # Compact separators keep stdlib lines in the same shape as orjson's
+    return (json.dumps(entry, separators=(',', ':')) + '\n').encode()
+
+
+# Placeholder for an iso_time field, filled in from 'timestamp' when the record is encoded
+_ISO_PENDING = object()
+
+# fdatasync skips the metadata flush where the platform has it (not macOS/Windows)
+_datasync = getattr(os, 'fdatasync', os.fsync)
+
+# O_APPEND makes every write(2) land at end of file; O_BINARY stops Windows newline translation
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+
+
+# Gather writes hand the kernel every line of a batch without joining them first
+_writev = getattr(os, 'writev', None)
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX') if _writev is not None else 0
+except (AttributeError, ValueError, OSError):  # pragma: no cover
+    _IOV_MAX = 16  # POSIX minimum
+
+
+def _append(fd: int, data: bytes, sync: bool = True):
+    """Write all of data to an O_APPEND descriptor, then sync it unless told not to"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    if sync:
+        _datasync(fd)
+
+
+def _append_lines(fd: int, lines: List[bytes], sync: bool = True):
+    """Write all lines to an O_APPEND descriptor, with one writev(2) where possible"""
+    if _writev is None or len(lines) > _IOV_MAX:
+        _append(fd, b''.join(lines), sync)
+        return
+    written = _writev(fd, lines)
+    if written < sum(map(len, lines)):
+        # Short write: finish the remainder the plain way (append keeps it in order)
+        _append(fd, b''.join(lines)[written:], sync)
+        return
+    if sync:
+        _datasync(fd)
+
+
+def _close_at_exit(ref: "weakref.ref[LoggerManager]"):
+    """atexit hook: flush a manager that was never closed explicitly"""
+    manager = ref()
+    if manager is not None:
+        manager.close()
+
 
 class LoggerManager:
     """Central coordinator for BLAST logging system"""
     
-    def __init__(self, log_dir: Path, config_path: Optional[Path] = None):
+    def __init__(self, log_dir: Path, config_path: Optional[Path] = None, max_queued_writes: int = 0):
         self.base_log_dir = Path(log_dir)
         self.base_log_dir.mkdir(parents=True, exist_ok=True)
         
@@ -39,6 +113,7 @@ class LoggerManager:
         
         # Setup Python logging
         self._setup_logging(config_path)
+        self._install_queue_logging()
         
         # Statistics
         self.stats = {
@@ -47,21 +122,84 @@ class LoggerManager:
             'serial_writes': 0,
             'performance_writes': 0,
             'error_writes': 0,
+            'write_errors': 0,
+            'dropped_writes': 0,
             'start_time': time.time()
         }
         
+        # Failed appends per file, so callers can watch the files they care about
+        self._path_write_errors: Dict[Path, int] = {}
+        
         self.logger = logging.getLogger('blast.manager')
+        self._log_error = self.logger.error
+        
+        # (base dir mtime_ns, [run dir paths]) from the last run directory scan
+        self._run_index: Optional[Tuple[int, List[str]]] = None
+        
+        # data.csv lines are appended by the writer thread; csv.writer only formats the header
+        self._csv_header_written = False
+        self._csv_buffer = io.StringIO()
+        self._csv_writer = csv.writer(self._csv_buffer)
+        
+        # (second, "YYYY-MM-DDTHH:MM:SS") of the last formatted iso_time; writer thread only
+        self._iso_cache: Tuple[int, str] = (-1, '')
+        
+        # Background writer: log_* calls only enqueue (path, record) and a single
+        # thread encodes and appends them in batches, one write per file per batch. A batch
+        # is flushed once it is 30% of _max_batch or its oldest line is
+        # _flush_interval seconds old, whichever comes first.
+        # With max_queued_writes > 0 the queue is bounded and records that
+        # don't fit are dropped (counted in dropped_writes) instead of
+        # letting a stalled disk grow memory without limit.
+        if max_queued_writes > 0:
+            self._write_queue: Any = queue.Queue(maxsize=max_queued_writes)
+            self._queue_put = self._write_queue.put_nowait
+        else:
+            self._write_queue = queue.SimpleQueue()
+            self._queue_put = self._write_queue.put
+        self._max_batch = 256
+        self._flush_threshold = max(1, int(self._max_batch * 0.3))
+        self._flush_interval = 1.0
+        # Soft cap on the bytes buffered for one file before it is written out
+        self._max_write_bytes = 128 * 1024
+        # Queue depth without qsize(): producers publish next() of a shared
+        # counter (atomic under the GIL), the writer alone counts drained items
+        self._enqueue_counter = itertools.count(1)
+        # Bound once: _enqueue runs for every log record
+        self._next_enqueued = self._enqueue_counter.__next__
+        self._enqueued = 0
+        self._dequeued = 0
+        # Held while checking _closed and enqueueing, and while close() queues
+        # its sentinel, so no record can land behind the sentinel and be lost
+        self._enqueue_lock = threading.Lock()
+        self._closed = False
+        self._writer_thread = threading.Thread(target=self._writer_loop, name='blast-log-writer', daemon=True)
+        self._writer_thread.start()
+        # The writer is a daemon thread: without this, lines still queued when
+        # the interpreter exits outside the app shutdown hook would be lost
+        self._atexit_hook = partial(_close_at_exit, weakref.ref(self))
+        atexit.register(self._atexit_hook)
+        
         self.logger.info("BLAST Logger Manager initialized")
     
     def _create_latest_symlink(self):
         """Create 'latest' symlink to current run directory"""
         try:
             latest_symlink = self.base_log_dir / 'latest'
-            # Remove existing symlink if it exists
-            if latest_symlink.exists() or latest_symlink.is_symlink():
-                latest_symlink.unlink()
-            # Create symlink to current run directory
-            latest_symlink.symlink_to(self.run_timestamp)
+            # Build the new link beside the old one and rename it over the top:
+            # one atomic swap, so 'latest' never dangles or goes missing
+            tmp_link = self.base_log_dir / f'.latest.{os.getpid()}.tmp'
+            # A crashed process that had this pid may have left its temp link behind
+            try:
+                os.unlink(tmp_link)
+            except FileNotFoundError:
+                pass
+            os.symlink(self.run_timestamp, tmp_link)
+            try:
+                os.replace(tmp_link, latest_symlink)
+            except Exception:
+                os.unlink(tmp_link)
+                raise
                 
         except Exception as e:
             # Symlinks might not work on all systems, so just log the error
@@ -69,6 +207,8 @@ class LoggerManager:
     
     def _setup_logging(self, config_path: Optional[Path]):
         """Setup Python logging configuration"""
+        root = logging.getLogger()
+        existing = set(root.handlers)
         if config_path and config_path.exists():
             with open(config_path) as f:
                 import yaml
@@ -84,6 +224,39 @@ class LoggerManager:
                     logging.FileHandler(self.system_log)
                 ]
             )
+        # Handlers this manager created; handlers owned by other code are left alone
+        self._own_handlers = [h for h in root.handlers if h not in existing]
+    
+    def _install_queue_logging(self):
+        """Move this manager's root handlers behind a QueueListener so log calls never block on I/O"""
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
+        self._queue_handler: Optional[logging.handlers.QueueHandler] = None
+        root = logging.getLogger()
+        handlers = [h for h in self._own_handlers if h in root.handlers]
+        # Nothing of ours to wrap, or another manager's queue is already in place
+        if not handlers or any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers):
+            return
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._queue_handler = logging.handlers.QueueHandler(log_queue)
+        self._log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        for h in handlers:
+            root.removeHandler(h)
+        root.addHandler(self._queue_handler)
+        self._log_listener.start()
+    
+    def _remove_queue_logging(self):
+        """Drain the log queue and hand this manager's handlers back to the root logger"""
+        if self._log_listener is None:
+            return
+        self._log_listener.stop()
+        root = logging.getLogger()
+        if self._queue_handler in root.handlers:
+            root.removeHandler(self._queue_handler)
+            for h in self._log_listener.handlers:
+                if h not in root.handlers:
+                    root.addHandler(h)
+        self._log_listener = None
+        self._queue_handler = None
     
     def log_data(self, timestamp: float, raw: Dict, adjusted: Dict, offsets: Dict):
         """
@@ -104,75 +277,99 @@ class LoggerManager:
                 'offsets': offsets,
                 'logged_at': time.time()
             }
-            with open(self.data_log, 'a') as f:
-                f.write(json.dumps(entry) + '\n')
+            self._enqueue(self.data_log, entry)
             self.stats['data_writes'] += 1
         except Exception as e:
-            self.logger.error(f"Failed to log data: {e}")
+            self._log_error(f"Failed to log data: {e}")
 
 
     def log_data_csv(self, timestamp: float, raw: Dict, adjusted: Dict, offsets: Dict, settings):
         """Log sensor data to data.csv"""
         try:
-            if not os.path.exists(self.data_csv_log):
-                header =( 
-                    ["recieved_at"] +
-                    ["t_seconds"] +
-                    [("raw_" + rawKeys.get("id")) for rawKeys in settings.PRESSURE_TRANSDUCERS] +
-                    [("raw_" + rawKeys.get("id")) for rawKeys in settings.THERMOCOUPLES] +
-                    [("raw_" + rawKeys.get("id")) for rawKeys in settings.LOAD_CELLS] +
-                    [("raw_fcv_actual_" + fcvKeys.get("id")) for fcvKeys in settings.FLOW_CONTROL_VALVES] +
-                    [("raw_fcv_expected_" + fcvKeys.get("id")) for fcvKeys in settings.FLOW_CONTROL_VALVES] +
-                    [("adjusted_" + adjustedKeys.get("id")) for adjustedKeys in settings.PRESSURE_TRANSDUCERS] +
-                    [("adjusted_" + adjustedKeys.get("id")) for adjustedKeys in settings.THERMOCOUPLES] +
-                    [("adjusted_" + adjustedKeys.get("id")) for adjustedKeys in settings.LOAD_CELLS] +
-                    [("adjusted_fcv_actual_" + fcvKeys.get("id")) for fcvKeys in settings.FLOW_CONTROL_VALVES] +
-                    [("adjusted_fcv_expected_" + fcvKeys.get("id")) for fcvKeys in settings.FLOW_CONTROL_VALVES] +
-                    [("offset_" + offsetsKeys) for offsetsKeys in offsets] +
-                    ["logged_at"]
-                    )
-                with open(self.data_csv_log, 'a', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(header)
+            if not self._csv_header_written:
+                # Checked once per run; the header comes from settings, which don't change
+                if not os.path.exists(self.data_csv_log):
+                    self._enqueue(self.data_csv_log, self._csv_line(self._csv_header(offsets, settings)))
+                self._csv_header_written = True
                     
-            combined = (
-                [timestamp] +
-                [timestamp - self.stats["start_time"]] +
-                [rawVal for rawArr in raw.values() for rawVal in rawArr] + 
-                [adjustedVal for adjustedArr in adjusted.values() for adjustedVal in adjustedArr] +
-                [offset for offset in offsets.values()] +
-                [time.time()]
-                )
+            # Chained rather than concatenated, so no intermediate lists are built
+            combined = itertools.chain(
+                (timestamp, timestamp - self.stats["start_time"]),
+                itertools.chain.from_iterable(raw.values()),
+                itertools.chain.from_iterable(adjusted.values()),
+                offsets.values(),
+                (time.time(),),
+            )
             
-            with open(self.data_csv_log, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(combined)
+            # Format fields as csv.writer would (None is empty) and join them
+            # directly; a field that needs quoting sends the row through csv.writer
+            fields = ['' if value is None else str(value) for value in combined]
+            line = ','.join(fields)
+            if line.count(',') != len(fields) - 1 or '"' in line or '\n' in line or '\r' in line:
+                data = self._csv_line(fields)
+            else:
+                data = (line + '\r\n').encode()
+            self._enqueue(self.data_csv_log, data)
         except Exception as e:
-            self.logger.error(f"Failed to log data: {e}")
+            self._log_error(f"Failed to log data: {e}")
+    
+    @staticmethod
+    def _csv_header(offsets: Dict, settings) -> List[str]:
+        """Column names for data.csv, in the order log_data_csv writes values"""
+        return (
+            ["recieved_at"] +
+            ["t_seconds"] +
+            [("raw_" + rawKeys.get("id")) for rawKeys in settings.PRESSURE_TRANSDUCERS] +
+            [("raw_" + rawKeys.get("id")) for rawKeys in settings.THERMOCOUPLES] +
+            [("raw_" + rawKeys.get("id")) for rawKeys in settings.LOAD_CELLS] +
+            [("raw_fcv_actual_" + fcvKeys.get("id")) for fcvKeys in settings.FLOW_CONTROL_VALVES] +
+            [("raw_fcv_expected_" + fcvKeys.get("id")) for fcvKeys in settings.FLOW_CONTROL_VALVES] +
+            [("adjusted_" + adjustedKeys.get("id")) for adjustedKeys in settings.PRESSURE_TRANSDUCERS] +
+            [("adjusted_" + adjustedKeys.get("id")) for adjustedKeys in settings.THERMOCOUPLES] +
+            [("adjusted_" + adjustedKeys.get("id")) for adjustedKeys in settings.LOAD_CELLS] +
+            [("adjusted_fcv_actual_" + fcvKeys.get("id")) for fcvKeys in settings.FLOW_CONTROL_VALVES] +
+            [("adjusted_fcv_expected_" + fcvKeys.get("id")) for fcvKeys in settings.FLOW_CONTROL_VALVES] +
+            [("offset_" + offsetsKeys) for offsetsKeys in offsets] +
+            ["logged_at"]
+        )
     
-    def log_event(self, event_type: str, message: str, data: Optional[Dict] = None):
+    def _csv_line(self, row: Iterable[Any]) -> bytes:
+        """Format one CSV row with the shared writer, line terminator included"""
+        buf = self._csv_buffer
+        self._csv_writer.writerow(row)
+        line = buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+        return line.encode()
+    
+    def log_event(self, event_type: str, message: str, data: Optional[Dict] = None,
+                  session_id: Optional[int] = None, sequence: Optional[int] = None):
         """Log application events to events.jsonl"""
         try:
+            now = time.time()
             entry = {
-                'timestamp': time.time(),
-                't_seconds' : time.time() - self.stats["start_time"],
+                'timestamp': now,
+                't_seconds' : now - self.stats["start_time"],
                 'event_type': event_type,
                 'message': message,
                 'data': data or {},
-                'iso_time': datetime.now().isoformat()
+                'iso_time': _ISO_PENDING  # Formatted by the writer thread
             }
-            with open(self.events_log, 'a') as f:
-                f.write(json.dumps(entry) + '\n')
+            if session_id is not None:
+                entry['session_id'] = session_id
+                entry['event_sequence'] = sequence
+            self._enqueue(self.events_log, entry)
             self.stats['event_writes'] += 1
         except Exception as e:
-            self.logger.error(f"Failed to log event: {e}")
+            self._log_error(f"Failed to log event: {e}")
     
     def log_serial(self, direction: str, data: str, port: str, success: bool = True, error: Optional[str] = None):
         """Log serial communication to serial.jsonl"""
         try:
+            now = time.time()
             entry = {
-                'timestamp': time.time(),
-                't_seconds' : time.time() - self.stats["start_time"],
+                'timestamp': now,
+                't_seconds' : now - self.stats["start_time"],
                 'direction': direction,  # 'read' or 'write'
                 'port': port,
                 'data': data,
@@ -180,47 +377,222 @@ class LoggerManager:
                 'error': error,
                 'data_length': len(data) if data else 0
             }
-            with open(self.serial_log, 'a') as f:
-                f.write(json.dumps(entry) + '\n')
+            self._enqueue(self.serial_log, entry)
             self.stats['serial_writes'] += 1
         except Exception as e:
-            self.logger.error(f"Failed to log serial: {e}")
+            self._log_error(f"Failed to log serial: {e}")
     
     def log_performance(self, metric_type: str, value: float, unit: str, context: Optional[Dict] = None):
         """Log performance metrics to performance.jsonl"""
         try:
+            now = time.time()
             entry = {
-                'timestamp': time.time(),
-                't_seconds' : time.time() - self.stats["start_time"],
+                'timestamp': now,
+                't_seconds' : now - self.stats["start_time"],
                 'metric_type': metric_type,
                 'value': value,
                 'unit': unit,
                 'context': context or {}
             }
-            with open(self.performance_log, 'a') as f:
-                f.write(json.dumps(entry) + '\n')
+            self._enqueue(self.performance_log, entry)
             self.stats['performance_writes'] += 1
         except Exception as e:
-            self.logger.error(f"Failed to log performance: {e}")
+            self._log_error(f"Failed to log performance: {e}")
+    
+    def log_performance_batch(self, metrics: Iterable[Tuple[str, float, str]], context: Optional[Dict] = None):
+        """Log several (metric_type, value, unit) samples to performance.jsonl in one enqueue"""
+        try:
+            now = time.time()
+            t_seconds = now - self.stats["start_time"]
+            ctx = context or {}
+            # A tuple is written as one JSONL record per element
+            records = tuple(
+                {
+                    'timestamp': now,
+                    't_seconds': t_seconds,
+                    'metric_type': metric_type,
+                    'value': value,
+                    'unit': unit,
+                    'context': ctx
+                }
+                for metric_type, value, unit in metrics
+            )
+            if records:
+                self._enqueue(self.performance_log, records)
+                self.stats['performance_writes'] += len(records)
+        except Exception as e:
+            self._log_error(f"Failed to log performance batch: {e}")
     
     def log_error(self, error_type: str, message: str, exception: Optional[Exception] = None, context: Optional[Dict] = None):
         """Log errors to errors.jsonl"""
         try:
+            now = time.time()
             entry = {
-                'timestamp': time.time(),
-                't_seconds' : time.time() - self.stats["start_time"],
+                'timestamp': now,
+                't_seconds' : now - self.stats["start_time"],
                 'error_type': error_type,
                 'message': message,
                 'exception': str(exception) if exception else None,
                 'exception_type': type(exception).__name__ if exception else None,
                 'context': context or {},
-                'iso_time': datetime.now().isoformat()
+                'iso_time': _ISO_PENDING  # Formatted by the writer thread
             }
-            with open(self.errors_log, 'a') as f:
-                f.write(json.dumps(entry) + '\n')
+            self._enqueue(self.errors_log, entry)
             self.stats['error_writes'] += 1
         except Exception as e:
-            self.logger.error(f"Failed to log error: {e}")
+            self._log_error(f"Failed to log error: {e}")
+    
+    def _iso_time(self, now: float) -> str:
+        """Local ISO-8601 time for a timestamp, formatting the date part once per second"""
+        sec = int(now)
+        cached_sec, prefix = self._iso_cache
+        if sec != cached_sec:
+            prefix = datetime.fromtimestamp(sec).isoformat()
+            self._iso_cache = (sec, prefix)
+        return f"{prefix}.{min(999999, round((now - sec) * 1e6)):06d}"
+    
+    def append_line(self, path: Path, line: Union[str, bytes]):
+        """Append a preformatted line to any file through the batched writer"""
+        self._enqueue(Path(path), line.encode() if isinstance(line, str) else line)
+    
+    def append_record(self, path: Path, record: Dict):
+        """Append one JSON record to any file, encoded on the writer thread"""
+        self._enqueue(Path(path), record)
+    
+    def _enqueue(self, path: Path, line: Any):
+        """Hand a record to the writer thread (written inline, unsynced, once closed)
+
+        line is preformatted bytes, a JSON-serializable record, or a tuple of
+        records; records are encoded on the writer thread, so callers must not
+        mutate them after logging.
+        """
+        with self._enqueue_lock:
+            if not self._closed:
+                try:
+                    self._queue_put((path, line))
+                except queue.Full:
+                    self.stats['dropped_writes'] += 1
+                    return
+                self._enqueued = self._next_enqueued()
+                return
+        # Late records after close() go straight to the file; the caller may be
+        # the event loop, so they are appended without an fdatasync
+        self._write_batch([(path, line)])
+    
+    def _writer_loop(self):
+        """Drain the write queue in batches until the close sentinel arrives"""
+        q = self._write_queue
+        # Descriptors stay open for the writer's lifetime instead of reopening per batch
+        handles: Dict[Path, int] = {}
+        while True:
+            batch = [q.get()]
+            deadline = time.monotonic() + self._flush_interval
+            # Let the batch fill up instead of writing on every wakeup
+            while len(batch) < self._flush_threshold and batch[-1] is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(q.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            # Take whatever else is already queued without waiting
+            while len(batch) < self._max_batch and batch[-1] is not None:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in batch
+            items = [item for item in batch if item is not None]
+            self._write_batch(items, handles)
+            self._dequeued += len(items)
+            if stop:
+                for fd in handles.values():
+                    try:
+                        os.close(fd)
+                    except Exception:
+                        pass
+                return
+    
+    def _write_batch(self, batch: List[Tuple[Path, Any]], handles: Optional[Dict[Path, int]] = None):
+        """Encode and append a batch of records, grouped so each file gets a single write and sync
+
+        A file's pending bytes are written early once they reach
+        _max_write_bytes, bounding the buffer held per file. With handles
+        (the writer thread), descriptors are opened once and kept in that
+        dict; without (inline writes after close), each file is opened and
+        closed around its write and not synced.
+        """
+        pending: Dict[Path, List[bytes]] = {}
+        sizes: Dict[Path, int] = {}
+        cap = self._max_write_bytes
+        for path, record in batch:
+            try:
+                if isinstance(record, bytes):
+                    line = record
+                elif isinstance(record, tuple):
+                    line = b''.join(map(_jsonl, record))
+                else:
+                    if record.get('iso_time') is _ISO_PENDING:
+                        record['iso_time'] = self._iso_time(record['timestamp'])
+                    line = _jsonl(record)
+            except Exception as e:
+                self.stats['write_errors'] += 1
+                self._log_error(f"Failed to encode record for {path.name}: {e}")
+                continue
+            lines = pending.setdefault(path, [])
+            lines.append(line)
+            size = sizes.get(path, 0) + len(line)
+            if size >= cap:
+                self._write_lines(path, pending.pop(path), handles)
+                size = 0
+            sizes[path] = size
+        for path, lines in pending.items():
+            self._write_lines(path, lines, handles)
+    
+    def _write_lines(self, path: Path, lines: List[bytes], handles: Optional[Dict[Path, int]]):
+        """Append encoded lines to one file with a single gather write (synced on the writer)"""
+        try:
+            if handles is None:
+                fd = os.open(path, _APPEND_FLAGS, 0o644)
+                try:
+                    _append_lines(fd, lines, sync=False)
+                finally:
+                    os.close(fd)
+                return
+            fd = handles.get(path)
+            if fd is None:
+                fd = handles[path] = os.open(path, _APPEND_FLAGS, 0o644)
+            _append_lines(fd, lines)
+        except Exception as e:
+            self.stats['write_errors'] += len(lines)
+            self._path_write_errors[path] = self._path_write_errors.get(path, 0) + len(lines)
+            self._log_error(f"Failed to write {path.name}: {e}")
+            # Reopen on the next batch rather than reuse a descriptor in an unknown state
+            if handles is not None and path in handles:
+                try:
+                    os.close(handles.pop(path))
+                except Exception:
+                    pass
+    
+    def close(self):
+        """Flush pending log lines and stop the writer and log listener threads"""
+        with self._enqueue_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._write_queue.put(None)  # Blocks rather than drops when the queue is bounded and full
+        self._writer_thread.join(timeout=5.0)
+        self._remove_queue_logging()
+        atexit.unregister(self._atexit_hook)
+    
+    def write_errors_for(self, *paths: Path) -> int:
+        """Number of lines that failed to append to the given files"""
+        return sum(self._path_write_errors.get(Path(path), 0) for path in paths)
+    
+    def queue_depth(self) -> int:
+        """Approximate number of lines waiting for the writer thread"""
+        return max(0, self._enqueued - self._dequeued)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get logging statistics"""
@@ -229,6 +601,7 @@ class LoggerManager:
             **self.stats,
             'uptime_seconds': uptime,
             'uptime_formatted': f"{uptime/3600:.1f}h",
+            'write_queue_depth': self.queue_depth(),
             'run_info': {
                 'run_timestamp': self.run_timestamp,
                 'run_directory': str(self.log_dir),
@@ -245,21 +618,46 @@ class LoggerManager:
             }
         }
     
+    def _run_dirs(self) -> List[str]:
+        """Past run directory paths, rescanning only when the base dir changes"""
+        # Creating, renaming or removing a run directory bumps the base
+        # directory's own mtime, so an unchanged mtime means the same runs.
+        # Only the listing is cached: a run dir's own mtime changes without
+        # touching the base dir, so those are read fresh on every cleanup.
+        base_mtime = os.stat(self.base_log_dir).st_mtime_ns
+        cached = self._run_index
+        if cached is not None and cached[0] == base_mtime:
+            return cached[1]
+        current = str(self.log_dir)
+        # One directory read; scandir entries carry d_type, so no stat per entry
+        with os.scandir(self.base_log_dir) as entries:
+            runs = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith("20")  # Directories starting with year
+                and not entry.name.endswith(".archived")
+                and entry.path != current
+                and entry.is_dir(follow_symlinks=False)
+            ]
+        self._run_index = (base_mtime, runs)
+        return runs
+    
     def cleanup_old_runs(self, days: int = 7):
         """Clean up old run directories older than specified days"""
         cutoff = time.time() - (days * 24 * 3600)
         cleaned = 0
         
-        for run_dir in self.base_log_dir.glob("20*"):  # Directories starting with year
-            if run_dir.is_dir() and run_dir.stat().st_mtime < cutoff:
-                try:
-                    # Archive instead of delete
-                    archive_name = f"{run_dir.name}.archived"
-                    archive_path = self.base_log_dir / archive_name
-                    run_dir.rename(archive_path)
-                    cleaned += 1
-                except Exception as e:
-                    self.logger.error(f"Failed to archive run directory {run_dir}: {e}")
+        for run_dir in self._run_dirs():
+            try:
+                if os.stat(run_dir, follow_symlinks=False).st_mtime >= cutoff:
+                    continue
+                # Archive instead of delete
+                os.rename(run_dir, f"{run_dir}.archived")
+                cleaned += 1
+            except FileNotFoundError:
+                continue  # Removed since the listing was cached
+            except Exception as e:
+                self._log_error(f"Failed to archive run directory {run_dir}: {e}")
         
         self.log_event('system', f'Log cleanup completed, archived {cleaned} run directories')
         return cleaned
@@ -267,18 +665,23 @@ class LoggerManager:
     def create_run_summary(self):
         """Create a summary file for this run"""
         try:
+            now = time.time()
             summary = {
                 'run_timestamp': self.run_timestamp,
                 'start_time': self.stats['start_time'],
-                'end_time': time.time(),
-                'duration_seconds': time.time() - self.stats['start_time'],
+                'end_time': now,
+                'duration_seconds': now - self.stats['start_time'],
                 'statistics': dict(self.stats),
                 'log_files_created': list(self.log_files.keys()) if hasattr(self, 'log_files') else []
             }
             
             summary_file = self.log_dir / 'run_summary.json'
-            with open(summary_file, 'w') as f:
-                json.dump(summary, f, indent=2)
+            if orjson is not None:
+                body = orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                body = json.dumps(summary, indent=2).encode()
+            with open(summary_file, 'wb') as f:
+                f.write(body)
                 
         except Exception as e:
-            self.logger.error(f"Failed to create run summary: {e}")
\ No newline at end of file
+            self._log_error(f"Failed to create run summary: {e}")
\ No newline at end of file
@@ -3,11 +3,15 @@ BLAST Performance Monitor - System performance tracking and alerting
 """
 
 import logging
+import os
 import time
+import tracemalloc
 import psutil
 import threading
-from typing import Dict, Any, Optional, List
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Tuple
 from collections import deque
+from itertools import islice
 from dataclasses import dataclass
 
 
@@ -24,6 +28,38 @@ class PerformanceThresholds:
     api_response_critical_ms: float = 2000.0
 
 
+class _HighWaterLeakSampler:
+    """Snapshot allocations only when RSS sets a new high-water mark.
+
+    tracemalloc slows the process down, so this is opt-in
+    (BLAST_LEAK_CHECK=1). Each new peak is diffed against the previous
+    peak's snapshot, so steady-state memory never triggers a snapshot.
+    """
+    
+    def __init__(self, growth: float = 1.02, top_n: int = 10):
+        self.growth = growth
+        self.top_n = top_n
+        self._peak_rss_mb = 0.0
+        self._peak_snapshot = None
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(3)
+    
+    def sample(self, rss_mb: float) -> List[str]:
+        """Return the top growing allocation sites if rss_mb is a new peak"""
+        if rss_mb <= self._peak_rss_mb * self.growth:
+            return []
+        self._peak_rss_mb = rss_mb
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+        previous, self._peak_snapshot = self._peak_snapshot, snapshot
+        if previous is None:
+            return []
+        diff = snapshot.compare_to(previous, 'lineno')
+        return [str(stat) for stat in diff[:self.top_n] if stat.size_diff > 0]
+
+
 class PerformanceMonitor:
     """Monitors system performance and logs metrics"""
     
@@ -31,6 +67,11 @@ class PerformanceMonitor:
         self.logger_manager = logger_manager
         self.logger = logging.getLogger('blast.performance')
         self.thresholds = thresholds or PerformanceThresholds()
+        # Threshold values bound once for the per-sample checks; assign a new
+        # thresholds object through set_thresholds() to change them
+        self._bind_thresholds()
+        # Resolved once rather than probed with hasattr() on every alert
+        self._event_logger = getattr(logger_manager, 'event_logger', None)
         
         # Performance history
         self.cpu_history = deque(maxlen=100)
@@ -38,10 +79,29 @@ class PerformanceMonitor:
         self.response_times = deque(maxlen=100)
         self.data_lag_history = deque(maxlen=100)
         
-        # Timing contexts
+        # Timing contexts; bounded so timers that are never ended can't grow it forever
         self.active_timers = {}
+        self._max_active_timers = 1000
+        
+        # Own-process handle, reused across checks. The first cpu_percent(None)
+        # calls prime psutil's deltas so later samples don't need to block;
+        # each sample then averages over the time since the previous check.
+        self._process = psutil.Process()
+        self._process.cpu_percent(None)
+        psutil.cpu_percent(None)
+        
+        # Handle-leak tracking: the cheap count is taken every check; the
+        # expensive open_files() listing only when the count jumps
+        self._last_open_handles: Optional[int] = None
+        self._known_open_files: set = set()
+        self._handle_jump_threshold = 5
         
-        # Statistics
+        # Opt-in allocation sampler for leak hunting
+        leak_check = os.environ.get('BLAST_LEAK_CHECK', '').lower() in ('1', 'true', 'yes')
+        self._leak_sampler = _HighWaterLeakSampler() if leak_check else None
+        
+        # Statistics; monitoring_start is wall clock for display, uptime uses the monotonic clock
+        self._monitoring_start_ns = time.monotonic_ns()
         self.stats = {
             'alerts_sent': 0,
             'monitoring_start': time.time(),
@@ -53,13 +113,28 @@ class PerformanceMonitor:
         # Monitoring thread
         self._monitoring = False
         self._monitor_thread = None
+        self._stop_event = threading.Event()  # Wakes the monitor loop on stop
         
         self.start_monitoring()
     
+    def _bind_thresholds(self):
+        """Copy the threshold values into attributes read by the checks"""
+        t = self.thresholds
+        self._cpu_warn, self._cpu_crit = t.cpu_percent_warning, t.cpu_percent_critical
+        self._mem_warn, self._mem_crit = t.memory_percent_warning, t.memory_percent_critical
+        self._lag_warn, self._lag_crit = t.data_lag_warning_ms, t.data_lag_critical_ms
+        self._api_warn, self._api_crit = t.api_response_warning_ms, t.api_response_critical_ms
+    
+    def set_thresholds(self, thresholds: PerformanceThresholds):
+        """Replace the alert thresholds"""
+        self.thresholds = thresholds
+        self._bind_thresholds()
+    
     def start_monitoring(self):
         """Start background performance monitoring"""
         if not self._monitoring:
             self._monitoring = True
+            self._stop_event.clear()
             self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self._monitor_thread.start()
             self.logger.info("Performance monitoring started")
@@ -67,25 +142,28 @@ class PerformanceMonitor:
     def stop_monitoring(self):
         """Stop background performance monitoring"""
         self._monitoring = False
+        self._stop_event.set()
         if self._monitor_thread:
             self._monitor_thread.join(timeout=5.0)
         self.logger.info("Performance monitoring stopped")
     
     def _monitor_loop(self):
         """Background monitoring loop"""
+        # Give the primed CPU counters a second to accumulate before the first sample
+        self._stop_event.wait(1)
         while self._monitoring:
             try:
                 self._check_system_performance()
-                time.sleep(30)  # Check every 30 seconds
+                self._stop_event.wait(30)  # Check every 30 seconds
             except Exception as e:
                 self.logger.error(f"Error in performance monitoring: {e}")
-                time.sleep(60)  # Wait longer on error
+                self._stop_event.wait(60)  # Wait longer on error
     
     def _check_system_performance(self):
         """Check system CPU, memory, and other metrics"""
         try:
             # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = psutil.cpu_percent(None)
             self.cpu_history.append({'timestamp': time.time(), 'value': cpu_percent})
             
             # Memory usage
@@ -93,11 +171,28 @@ class PerformanceMonitor:
             memory_percent = memory.percent
             self.memory_history.append({'timestamp': time.time(), 'value': memory_percent})
             
+            # Own-process usage; oneshot() reads /proc once for all three values.
+            # Handle count is a plain counter (num_fds/num_handles), not open_files().
+            process = self._process
+            with process.oneshot():
+                process_cpu = process.cpu_percent(None)
+                process_rss_mb = process.memory_info().rss / (1024**2)
+                open_handles = process.num_fds() if hasattr(process, 'num_fds') else process.num_handles()
+            
+            self._check_handle_growth(open_handles)
+            if self._leak_sampler is not None:
+                self._check_memory_growth(process_rss_mb)
+            
             # Log metrics
-            self.logger_manager.log_performance('cpu_percent', cpu_percent, 'percent')
-            self.logger_manager.log_performance('memory_percent', memory_percent, 'percent')
-            self.logger_manager.log_performance('memory_used_gb', memory.used / (1024**3), 'GB')
-            self.logger_manager.log_performance('memory_available_gb', memory.available / (1024**3), 'GB')
+            self.logger_manager.log_performance_batch([
+                ('cpu_percent', cpu_percent, 'percent'),
+                ('memory_percent', memory_percent, 'percent'),
+                ('memory_used_gb', memory.used / (1024**3), 'GB'),
+                ('memory_available_gb', memory.available / (1024**3), 'GB'),
+                ('process_cpu_percent', process_cpu, 'percent'),
+                ('process_rss_mb', process_rss_mb, 'MB'),
+                ('process_open_handles', open_handles, 'count'),
+            ])
             
             # Check thresholds
             self._check_cpu_threshold(cpu_percent)
@@ -108,26 +203,56 @@ class PerformanceMonitor:
         except Exception as e:
             self.logger.error(f"Failed to check system performance: {e}")
     
+    def _check_handle_growth(self, open_handles: int):
+        """List newly opened files when the handle count jumps between checks"""
+        last = self._last_open_handles
+        self._last_open_handles = open_handles
+        if last is None or open_handles - last <= self._handle_jump_threshold:
+            return
+        try:
+            paths = {f.path for f in self._process.open_files()}
+        except Exception as e:
+            self.logger.debug("Could not list open files: %s", e)
+            return
+        new_paths = sorted(paths - self._known_open_files)
+        self._known_open_files = paths
+        self.logger.warning("Open handles grew from %d to %d; new files: %s", last, open_handles, new_paths[:20])
+        self.logger_manager.log_performance(
+            'open_handles_jump', open_handles - last, 'count',
+            {'previous': last, 'current': open_handles, 'new_files': new_paths[:20]}
+        )
+    
+    def _check_memory_growth(self, rss_mb: float):
+        """Log the allocation sites behind a new RSS high-water mark"""
+        growth = self._leak_sampler.sample(rss_mb)
+        if growth:
+            self.logger.warning("RSS reached %.1f MB; top allocation growth:\n%s", rss_mb, "\n".join(growth))
+            self.logger_manager.log_performance('rss_high_water_mb', rss_mb, 'MB', {'top_growth': growth})
+    
     def _check_cpu_threshold(self, cpu_percent: float):
         """Check CPU usage against thresholds"""
-        if cpu_percent >= self.thresholds.cpu_percent_critical:
+        if cpu_percent >= self._cpu_crit:
             self._send_alert('cpu_critical', f"Critical CPU usage: {cpu_percent:.1f}%", 'critical')
-        elif cpu_percent >= self.thresholds.cpu_percent_warning:
+        elif cpu_percent >= self._cpu_warn:
             self._send_alert('cpu_warning', f"High CPU usage: {cpu_percent:.1f}%", 'warning')
     
     def _check_memory_threshold(self, memory_percent: float):
         """Check memory usage against thresholds"""
-        if memory_percent >= self.thresholds.memory_percent_critical:
+        if memory_percent >= self._mem_crit:
             self._send_alert('memory_critical', f"Critical memory usage: {memory_percent:.1f}%", 'critical')
-        elif memory_percent >= self.thresholds.memory_percent_warning:
+        elif memory_percent >= self._mem_warn:
             self._send_alert('memory_warning', f"High memory usage: {memory_percent:.1f}%", 'warning')
     
     def start_timer(self, operation: str) -> str:
         """Start timing an operation"""
-        timer_id = f"{operation}_{time.time()}"
+        start_ns = time.perf_counter_ns()
+        timer_id = f"{operation}_{start_ns}"
+        if len(self.active_timers) >= self._max_active_timers:
+            # Drop the oldest abandoned timer (dicts keep insertion order)
+            self.active_timers.pop(next(iter(self.active_timers)), None)
         self.active_timers[timer_id] = {
             'operation': operation,
-            'start_time': time.time()
+            'start_ns': start_ns
         }
         return timer_id
     
@@ -136,19 +261,59 @@ class PerformanceMonitor:
         if timer_id not in self.active_timers:
             return None
         
-        timer = self.active_timers.pop(timer_id)
-        duration = time.time() - timer['start_time']
-        duration_ms = duration * 1000
+        operation, duration_ns = self._stop_timer(timer_id)
+        self._record(operation, duration_ns)
+        return duration_ns / 1e9
+    
+    @contextmanager
+    def timer(self, operation: str):
+        """Time the enclosed block and log its duration
+
+        The start time lives in this frame rather than active_timers, so
+        concurrent timers for the same operation never share state.
+        """
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._record(operation, time.perf_counter_ns() - start_ns)
+    
+    def _record(self, operation: str, duration_ns: int):
+        """Log an operation's duration and check it against the API thresholds"""
+        duration_ms = duration_ns / 1e6
+        self.logger_manager.log_performance(f'{operation}_duration_ms', duration_ms, 'milliseconds')
+        self._check_operation_duration(operation, duration_ms)
+    
+    def log_read_cycle(self, timer_id: str, lag_ms: float) -> Optional[float]:
+        """End a data-read timer and log its duration together with the data lag in one write"""
+        if timer_id not in self.active_timers:
+            self.log_data_lag(lag_ms)
+            return None
         
-        operation = timer['operation']
+        operation, duration_ns = self._stop_timer(timer_id)
+        duration_ms = duration_ns / 1e6
         
-        # Log the performance metric
-        self.logger_manager.log_performance(f'{operation}_duration_ms', duration_ms, 'milliseconds')
+        self.logger_manager.log_performance_batch([
+            (f'{operation}_duration_ms', duration_ms, 'milliseconds'),
+            ('data_lag_ms', lag_ms, 'milliseconds'),
+        ])
         
+        self._check_operation_duration(operation, duration_ms)
+        self._check_data_lag(lag_ms)
+        return duration_ns / 1e9
+    
+    def _stop_timer(self, timer_id: str) -> Tuple[str, int]:
+        """Remove an active timer and return (operation, elapsed nanoseconds)"""
+        timer = self.active_timers.pop(timer_id)
+        # Integer nanoseconds on the monotonic high-resolution clock
+        return timer['operation'], time.perf_counter_ns() - timer['start_ns']
+    
+    def _check_operation_duration(self, operation: str, duration_ms: float):
+        """Track API response times and alert on slow API calls"""
         # Check for slow operations
-        if operation.startswith('api_') and duration_ms > self.thresholds.api_response_warning_ms:
+        if operation.startswith('api_') and duration_ms > self._api_warn:
             self.stats['slow_api_calls'] += 1
-            if duration_ms > self.thresholds.api_response_critical_ms:
+            if duration_ms > self._api_crit:
                 self._send_alert('api_slow_critical', f"Critical API response time: {duration_ms:.1f}ms for {operation}", 'critical')
             else:
                 self._send_alert('api_slow_warning', f"Slow API response: {duration_ms:.1f}ms for {operation}", 'warning')
@@ -157,31 +322,37 @@ class PerformanceMonitor:
         if operation.startswith('api_'):
             self.response_times.append({'timestamp': time.time(), 'operation': operation, 'duration_ms': duration_ms})
             self.stats['total_api_calls'] += 1
-        
-        return duration
     
     def log_data_lag(self, lag_ms: float):
         """Log data acquisition lag"""
-        self.data_lag_history.append({'timestamp': time.time(), 'lag_ms': lag_ms})
         self.logger_manager.log_performance('data_lag_ms', lag_ms, 'milliseconds')
+        self._check_data_lag(lag_ms)
+    
+    def _check_data_lag(self, lag_ms: float):
+        """Record data lag history and check lag thresholds"""
+        self.data_lag_history.append({'timestamp': time.time(), 'lag_ms': lag_ms})
         
         # Check lag thresholds
-        if lag_ms >= self.thresholds.data_lag_critical_ms:
+        if lag_ms >= self._lag_crit:
             self._send_alert('data_lag_critical', f"Critical data lag: {lag_ms:.1f}ms", 'critical')
-        elif lag_ms >= self.thresholds.data_lag_warning_ms:
+        elif lag_ms >= self._lag_warn:
             self._send_alert('data_lag_warning', f"High data lag: {lag_ms:.1f}ms", 'warning')
     
     def log_custom_metric(self, metric_name: str, value: float, unit: str, context: Dict = None):
         """Log custom performance metric"""
         self.logger_manager.log_performance(metric_name, value, unit, context)
     
+    def log_custom_metrics(self, metrics: List[Tuple[str, float, str]], context: Dict = None):
+        """Log several (metric_name, value, unit) samples at once"""
+        self.logger_manager.log_performance_batch(metrics, context)
+    
     def _send_alert(self, alert_type: str, message: str, severity: str):
         """Send performance alert"""
         self.stats['alerts_sent'] += 1
         
         # Log to event logger if available
-        if hasattr(self.logger_manager, 'event_logger'):
-            self.logger_manager.event_logger.log_performance_alert(alert_type, 0, 0, severity)
+        if self._event_logger is not None:
+            self._event_logger.log_performance_alert(alert_type, 0, 0, severity)
         
         # Log to performance log
         self.logger_manager.log_performance(f'alert_{alert_type}', 1, 'count', {'message': message, 'severity': severity})
@@ -194,13 +365,13 @@ class PerformanceMonitor:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive performance statistics"""
-        uptime = time.time() - self.stats['monitoring_start']
+        uptime = (time.monotonic_ns() - self._monitoring_start_ns) / 1e9
         
         # Calculate averages
-        recent_cpu = [item['value'] for item in list(self.cpu_history)[-10:]]
-        recent_memory = [item['value'] for item in list(self.memory_history)[-10:]]
-        recent_responses = [item['duration_ms'] for item in list(self.response_times)[-10:]]
-        recent_lag = [item['lag_ms'] for item in list(self.data_lag_history)[-10:]]
+        recent_cpu = [item['value'] for item in islice(reversed(self.cpu_history), 10)]
+        recent_memory = [item['value'] for item in islice(reversed(self.memory_history), 10)]
+        recent_responses = [item['duration_ms'] for item in islice(reversed(self.response_times), 10)]
+        recent_lag = [item['lag_ms'] for item in islice(reversed(self.data_lag_history), 10)]
         
         return {
             **self.stats,
@@ -247,16 +418,16 @@ class PerformanceMonitor:
         issues = []
         current = stats['current_metrics']
         
-        if current['avg_cpu_percent_recent'] > self.thresholds.cpu_percent_warning:
+        if current['avg_cpu_percent_recent'] > self._cpu_warn:
             issues.append(f"High CPU: {current['avg_cpu_percent_recent']:.1f}%")
         
-        if current['avg_memory_percent_recent'] > self.thresholds.memory_percent_warning:
+        if current['avg_memory_percent_recent'] > self._mem_warn:
             issues.append(f"High Memory: {current['avg_memory_percent_recent']:.1f}%")
         
-        if current['avg_response_time_ms_recent'] > self.thresholds.api_response_warning_ms:
+        if current['avg_response_time_ms_recent'] > self._api_warn:
             issues.append(f"Slow API: {current['avg_response_time_ms_recent']:.1f}ms")
         
-        if current['avg_data_lag_ms_recent'] > self.thresholds.data_lag_warning_ms:
+        if current['avg_data_lag_ms_recent'] > self._lag_warn:
             issues.append(f"Data Lag: {current['avg_data_lag_ms_recent']:.1f}ms")
         
         return {
@@ -4,11 +4,19 @@ BLAST Serial Logger - Serial communication monitoring and logging
 
 import logging
 import time
-import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, NamedTuple
 from collections import deque
 
 
+class IoActivity(NamedTuple):
+    """Fixed-layout recent-activity record for per-packet read/write events"""
+    timestamp: float
+    action: str
+    data_length: int
+    success: bool
+    error: Optional[str]
+
+
 class SerialLogger:
     """Handles detailed logging of serial port communication"""
     
@@ -30,6 +38,15 @@ class SerialLogger:
             'parse_errors': 0
         }
         
+        # Per-packet counters live in plain attributes and are folded into
+        # stats by get_stats(), keeping dict updates off the read/write path
+        self._successful_reads = 0
+        self._failed_reads = 0
+        self._bytes_read = 0
+        self._successful_writes = 0
+        self._failed_writes = 0
+        self._bytes_written = 0
+        
         # Keep recent activity in memory for debugging
         self.recent_activity = deque(maxlen=100)
         self.current_port = None
@@ -98,11 +115,12 @@ class SerialLogger:
     
     def log_data_read(self, raw_data: str, port: str, success: bool = True, error: Optional[str] = None):
         """Log data read from serial port"""
+        data_length = len(raw_data) if raw_data else 0
         if success:
-            self.stats['successful_reads'] += 1
-            self.stats['bytes_read'] += len(raw_data) if raw_data else 0
+            self._successful_reads += 1
+            self._bytes_read += data_length
         else:
-            self.stats['failed_reads'] += 1
+            self._failed_reads += 1
         
         # Only log non-empty reads or errors
         if raw_data or error:
@@ -114,21 +132,17 @@ class SerialLogger:
                 error=error
             )
         
-        self.recent_activity.append({
-            'timestamp': time.time(),
-            'action': 'data_read',
-            'data_length': len(raw_data) if raw_data else 0,
-            'success': success,
-            'error': error
-        })
+        self.recent_activity.append(IoActivity(
+            time.time(), 'data_read', data_length, success, error
+        ))
     
     def log_data_write(self, data: str, port: str, success: bool = True, error: Optional[str] = None):
         """Log data written to serial port"""
         if success:
-            self.stats['successful_writes'] += 1
-            self.stats['bytes_written'] += len(data)
+            self._successful_writes += 1
+            self._bytes_written += len(data)
         else:
-            self.stats['failed_writes'] += 1
+            self._failed_writes += 1
         
         self.logger_manager.log_serial(
             direction='write',
@@ -138,15 +152,12 @@ class SerialLogger:
             error=error
         )
         
-        self.logger.debug(f"Serial write: {len(data)} bytes {'successful' if success else 'failed'}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Serial write: %d bytes %s", len(data), 'successful' if success else 'failed')
         
-        self.recent_activity.append({
-            'timestamp': time.time(),
-            'action': 'data_write',
-            'data_length': len(data),
-            'success': success,
-            'error': error
-        })
+        self.recent_activity.append(IoActivity(
+            time.time(), 'data_write', len(data), success, error
+        ))
     
     def log_data_parse(self, raw_data: str, parsed_data: Dict, success: bool = True, error: Optional[str] = None):
         """Log data parsing results"""
@@ -163,9 +174,10 @@ class SerialLogger:
         }
         
         if success:
-            self.logger.debug(f"Parsed data packet: {parse_info}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Parsed data packet: %s", parse_info)
         else:
-            self.logger.warning(f"Failed to parse data: {raw_data[:100]}... Error: {error}")
+            self.logger.warning("Failed to parse data: %s... Error: %s", raw_data[:100], error)
         
         self.recent_activity.append({
             'timestamp': time.time(),
@@ -221,6 +233,14 @@ class SerialLogger:
         """Get comprehensive serial communication statistics"""
         current_time = time.time()
         uptime = current_time - self.connection_start_time if self.connection_start_time else 0
+        self.stats.update(
+            successful_reads=self._successful_reads,
+            failed_reads=self._failed_reads,
+            bytes_read=self._bytes_read,
+            successful_writes=self._successful_writes,
+            failed_writes=self._failed_writes,
+            bytes_written=self._bytes_written,
+        )
         
         return {
             **self.stats,
@@ -236,7 +256,10 @@ class SerialLogger:
     
     def get_recent_activity(self, limit: int = 50) -> list:
         """Get recent serial activity for debugging"""
-        return list(self.recent_activity)[-limit:]
+        return [
+            entry._asdict() if isinstance(entry, IoActivity) else entry
+            for entry in list(self.recent_activity)[-limit:]
+        ]
     
     def log_health_check(self):
         """Log periodic health check of serial communication"""
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import gc
 import sys
+import time
 from typing import Optional
 
 from fastapi import FastAPI
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
-import json
 import logging
 
 # Import comprehensive logging system
@@ -31,40 +32,89 @@ from .services.reading_cache import LatestReadingCache
 from .version import get_version
 
 
+def _sensor_ids(settings) -> tuple:
+    # Sensor definitions don't change for the life of the app; build the
+    # per-group ID lists once and keep them on the settings object
+    ids = getattr(settings, "_sensor_ids", None)
+    if ids is None:
+        ids = (
+            [pt.get("id") for pt in settings.PRESSURE_TRANSDUCERS],
+            [tc.get("id") for tc in settings.THERMOCOUPLES],
+            [lc.get("id") for lc in settings.LOAD_CELLS],
+        )
+        settings._sensor_ids = ids
+    return ids
+
+
 def _apply_offsets(raw: dict, offsets: dict, settings) -> dict:
-    # Build ID lists from settings
-    pt_ids = [pt.get("id") for pt in settings.PRESSURE_TRANSDUCERS]
-    tc_ids = [tc.get("id") for tc in settings.THERMOCOUPLES]
-    lc_ids = [lc.get("id") for lc in settings.LOAD_CELLS]
+    pt_ids, tc_ids, lc_ids = _sensor_ids(settings)
+    get_offset = offsets.get
 
     def adj_series(series: list, ids: list) -> list:
         out = []
+        append = out.append
+        n_ids = len(ids)
         for i, val in enumerate(series):
-            sid = ids[i] if i < len(ids) else None
-            off = offsets.get(sid, 0.0) if sid else 0.0
+            sid = ids[i] if i < n_ids else None
+            off = get_offset(sid, 0.0) if sid else 0.0
             try:
-                out.append(float(val) + float(off))
+                append(float(val) + float(off))
             except Exception:
-                out.append(val)
+                append(val)
         return out
 
     adjusted = {
         "pt": adj_series(raw.get("pt", []), pt_ids),
         "tc": adj_series(raw.get("tc", []), tc_ids),
         "lc": adj_series(raw.get("lc", []), lc_ids),
-        # Booleans: pass through
-        "fcv_actual": list(raw.get("fcv_actual", [])),
-        "fcv_expected": list(raw.get("fcv_expected", [])),
+        # Booleans: pass through; readings are never mutated once read, so
+        # adjusted shares the raw valve lists instead of copying them
+        "fcv_actual": raw.get("fcv_actual", []),
+        "fcv_expected": raw.get("fcv_expected", []),
     }
     return adjusted
 
 
+def _raw_from_value(value: dict) -> dict:
+    # Sensor groups in the canonical order the CSV header is written in;
+    # data sources may build their dicts in a different order.
+    return {
+        "pt": value["pt"],
+        "tc": value["tc"],
+        "lc": value["lc"],
+        "fcv_actual": value["fcv_actual"],
+        "fcv_expected": value["fcv_expected"],
+    }
+
+
 def _get_logs_path() -> Path:
     # Write logs alongside the legacy logs directory
     legacy_logs = FRONTEND_TEMPLATES.parent.parent / "logs"
     legacy_logs.mkdir(parents=True, exist_ok=True)
     return legacy_logs / "data.jsonl"
 
+def _create_data_source(app: FastAPI):
+    """Build the configured data source for this app.
+
+    Returns (source, name, reason). Construction does not touch hardware;
+    the caller is responsible for calling `initialize()`.
+    """
+    import os as _os
+    settings = app.state.settings
+    force_simulator = _os.environ.get('FORCE_SIMULATOR_MODE', '').lower() in ('1', 'true', 'yes')
+
+    if force_simulator or settings.DATA_SOURCE == "simulator":
+        settings._serial_monitor_buffer = app.state.serial_monitor_buffer
+        reason = 'CI environment override' if force_simulator else 'startup configuration'
+        return SimulatorSource(settings), 'simulator', reason
+
+    # Pass logging components to data source
+    settings._serial_logger = app.state.serial_logger
+    settings._freeze_detector = app.state.freeze_detector
+    settings._serial_monitor_buffer = app.state.serial_monitor_buffer
+    return SerialSource(settings), 'serial', 'startup configuration'
+
+
 def create_app() -> FastAPI:
     assert_legacy_layout()
 
@@ -82,18 +132,18 @@ def create_app() -> FastAPI:
     app.state.serial_logger = SerialLogger(app.state.logger_manager)
     app.state.performance_monitor = PerformanceMonitor(app.state.logger_manager)
     app.state.error_recovery = ErrorRecovery(app.state.logger_manager)
-    app.state.freeze_detector = FreezeDetector(app.state.logger_manager)
+    app.state.freeze_detector = FreezeDetector(app.state.logger_manager, autostart=False)
 
     # Shared state
     app.state.settings = settings
     app.state.cache = LatestReadingCache()
     app.state.serial_monitor_buffer = SerialMonitorBuffer(maxlen=1000)
     app.state.templates = Jinja2Templates(directory=str(FRONTEND_TEMPLATES))
+    app.state.data_source = None
     app.state.reader_task: Optional[asyncio.Task] = None
     app.state.healthy: bool = True
     app.state.health_error: Optional[str] = None
     app.state.data_log_path: Path = _get_logs_path()
-    app.state.data_log_errors: int = 0
     # Health thresholds (customizable via env)
     import os as _os
     try:
@@ -136,24 +186,12 @@ def create_app() -> FastAPI:
             app.state.health_error = f"calibration: {e}"
             print(f"FATAL: failed to load calibration offsets: {e}", file=sys.stderr)
             raise SystemExit(1)
-        # Choose data source (check for CI override first)
-        import os as _os
-        force_simulator = _os.environ.get('FORCE_SIMULATOR_MODE', '').lower() in ('1', 'true', 'yes')
-        
-        if force_simulator or settings.DATA_SOURCE == "simulator":
-            settings._serial_monitor_buffer = app.state.serial_monitor_buffer
-            source = SimulatorSource(settings)
-            data_source_name = 'simulator'
-            reason = 'CI environment override' if force_simulator else 'startup configuration'
-        else:
-            # Pass logging components to data source
-            settings._serial_logger = app.state.serial_logger
-            settings._freeze_detector = app.state.freeze_detector
-            settings._serial_monitor_buffer = app.state.serial_monitor_buffer
-            source = SerialSource(settings)
-            data_source_name = 'serial'
-            reason = 'startup configuration'
-            
+        # Choose data source (check for CI override first). The source is
+        # owned by this app instance so the serial port is opened exactly once
+        # per app, never at import time.
+        source, data_source_name, reason = _create_data_source(app)
+        app.state.data_source = source
+
         app.state.event_logger.log_data_source_change('unknown', data_source_name, reason)
 
         try:
@@ -161,40 +199,29 @@ def create_app() -> FastAPI:
             # Initial read (fail early if cannot produce data)
             value, ts = source.read_once()
             # Build raw numeric map (exclude timestamp)
-            raw = {
-                k: v for k, v in value.items() if k in ("pt", "tc", "lc", "fcv_actual", "fcv_expected")
-            }
+            raw = _raw_from_value(value)
             # Apply calibration offsets
             calib = app.state.calibration
             offsets = calib.get()
             adjusted = _apply_offsets(raw, offsets, app.state.settings)
-            # Preserve legacy behavior: include timestamp inside 'value'
-            value_adjusted = dict(adjusted)
-            value_adjusted["timestamp"] = ts
             app.state.cache.set_full({
                 "raw": raw,
                 "adjusted": adjusted,
                 "offsets": offsets,
                 "timestamp": ts,
-                "value": value_adjusted,
             })
             
             # Log data using comprehensive logging system
             app.state.logger_manager.log_data(ts, raw, adjusted, offsets)
             app.state.logger_manager.log_data_csv(ts, raw, adjusted, offsets, app.state.settings)
             
-            # Legacy logging fallback
-            try:
-                with app.state.data_log_path.open("a") as f:
-                    f.write(json.dumps({
-                        "ts": ts,
-                        "raw": raw,
-                        "adjusted": adjusted,
-                        "offsets": offsets,
-                    }) + "\n")
-            except Exception as e:
-                app.state.data_log_errors += 1
-                app.state.logger_manager.log_error('file_write_error', f'Failed to write legacy log: {e}')
+            # Legacy logging fallback, encoded and appended by the logger manager's writer thread
+            app.state.logger_manager.append_record(app.state.data_log_path, {
+                "ts": ts,
+                "raw": raw,
+                "adjusted": adjusted,
+                "offsets": offsets,
+            })
         except SystemExit:
             raise
         except Exception as e:
@@ -204,55 +231,44 @@ def create_app() -> FastAPI:
             raise SystemExit(1)
 
         async def reader_loop():
+            heartbeat = app.state.freeze_detector.heartbeater('data_acquisition')
             try:
                 while True:
                     # Heartbeat for freeze detection
-                    app.state.freeze_detector.heartbeat('data_acquisition')
+                    heartbeat()
                     
                     # Measure performance
                     timer_id = app.state.performance_monitor.start_timer('data_read')
                     
-                    value, ts = source.read_once()
-                    raw = {
-                        k: v for k, v in value.items() if k in ("pt", "tc", "lc", "fcv_actual", "fcv_expected")
-                    }
+                    # Serial reads block for up to the port timeout; run them
+                    # in a worker thread so requests keep being served.
+                    value, ts = await asyncio.to_thread(source.read_once)
+                    raw = _raw_from_value(value)
                     calib = app.state.calibration
                     offsets = calib.get()
                     adjusted = _apply_offsets(raw, offsets, app.state.settings)
-                    value_adjusted = dict(adjusted)
-                    value_adjusted["timestamp"] = ts
                     app.state.cache.set_full({
                         "raw": raw,
                         "adjusted": adjusted,
                         "offsets": offsets,
                         "timestamp": ts,
-                        "value": value_adjusted,
                     })
                     
                     # Log data using comprehensive logging system
                     app.state.logger_manager.log_data(ts, raw, adjusted, offsets)
                     app.state.logger_manager.log_data_csv(ts, raw, adjusted, offsets, app.state.settings)
                     
-                    # Legacy logging fallback
-                    try:
-                        with app.state.data_log_path.open("a") as f:
-                            f.write(json.dumps({
-                                "ts": ts,
-                                "raw": raw,
-                                "adjusted": adjusted,
-                                "offsets": offsets,
-                            }) + "\n")
-                    except Exception as e:
-                        app.state.data_log_errors += 1
-                        app.state.logger_manager.log_error('file_write_error', f'Failed to write legacy log: {e}')
-                    
-                    # End performance measurement
-                    app.state.performance_monitor.end_timer(timer_id)
+                    # Legacy logging fallback, encoded and appended by the logger manager's writer thread
+                    app.state.logger_manager.append_record(app.state.data_log_path, {
+                        "ts": ts,
+                        "raw": raw,
+                        "adjusted": adjusted,
+                        "offsets": offsets,
+                    })
                     
-                    # Check data lag
-                    import time as _t
-                    lag_ms = (_t.time() - ts) * 1000 if ts else 0
-                    app.state.performance_monitor.log_data_lag(lag_ms)
+                    # End performance measurement and check data lag (one performance log write)
+                    lag_ms = (time.time() - ts) * 1000 if ts else 0
+                    app.state.performance_monitor.log_read_cycle(timer_id, lag_ms)
                     
                     # Pace the loop to avoid blocking the event loop
                     interval = getattr(source, "update_interval_s", 0.1)
@@ -269,6 +285,14 @@ def create_app() -> FastAPI:
                 print(f"ERROR: reader loop stopped: {e}", file=sys.stderr)
 
         app.state.reader_task = asyncio.create_task(reader_loop())
+        # Watchdogs start with the reader so startup time never counts as a freeze
+        app.state.freeze_detector.start_monitoring()
+
+        # Startup objects (modules, routes, settings, templates) live for the
+        # whole run; collect once and move them out of the GC's scan set so
+        # later collections only walk per-tick garbage.
+        gc.collect()
+        gc.freeze()
 
     @app.on_event("shutdown")
     async def _shutdown():
@@ -288,6 +312,9 @@ def create_app() -> FastAPI:
                 await task
             except asyncio.CancelledError:
                 pass
+        
+        # Flush queued log writes last so shutdown events are included
+        app.state.logger_manager.close()
 
     @app.get("/healthz")
     async def healthz():
@@ -295,21 +322,24 @@ def create_app() -> FastAPI:
         offsets = calib.get() if calib else {}
         snap = app.state.cache.get_full()
         last_ts = snap.get("timestamp") if snap else None
-        import time as _t
-        now = _t.time()
+        now = time.time()
         lag_ms = None
         if isinstance(last_ts, (int, float)):
             lag_ms = max(0, (now - float(last_ts)) * 1000.0)
         # Derive health: base health AND lag under threshold
         lag_ok = (lag_ms is None) or (lag_ms < app.state.health_max_lag_ms)
-        data_log_ok = getattr(app.state, 'data_log_errors', 0) < app.state.health_max_log_errors
+        # Count lines the batched writer failed to append as well as serialization failures
+        # Only failed appends to the data logs count; other log files don't affect health
+        manager = app.state.logger_manager
+        data_log_errors = manager.write_errors_for(manager.data_log, app.state.data_log_path)
+        data_log_ok = data_log_errors < app.state.health_max_log_errors
         healthy = app.state.healthy and lag_ok and data_log_ok
         return {
             "status": "ok" if healthy else "error",
             "healthy": healthy,
             "error": app.state.health_error,
             "service": "fastapi",
-            "data_log_errors": getattr(app.state, 'data_log_errors', 0),
+            "data_log_errors": data_log_errors,
             "offsets_count": len(offsets),
             "lag_ms": lag_ms,
             "last_ts": last_ts,
@@ -322,9 +352,7 @@ def create_app() -> FastAPI:
         # Heartbeat for API monitoring
         app.state.freeze_detector.heartbeat('api_requests')
         
-        timer_id = app.state.performance_monitor.start_timer('api_logging_status')
-        
-        try:
+        with app.state.performance_monitor.timer('api_logging_status'):
             return {
                 "logger_manager": app.state.logger_manager.get_stats(),
                 "event_logger": app.state.event_logger.get_event_summary(),
@@ -338,8 +366,6 @@ def create_app() -> FastAPI:
                     "freeze_detector": app.state.freeze_detector.health_check()
                 }
             }
-        finally:
-            app.state.performance_monitor.end_timer(timer_id)
 
     return app
 
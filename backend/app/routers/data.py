@@ -1,61 +1,93 @@
 from __future__ import annotations
 
+from typing import Any, Callable, Dict
+
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 import time
 
 from ..schemas.data import DataEnvelope
 
+try:
+    import orjson  # Rust encoder for the hot /data payload
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 router = APIRouter()
 
 
-@router.get("/data", name="data")
-def get_data(request: Request, type: str = "all"):
-    cache = request.app.state.cache
-    snap = cache.get_full()
-    if not snap:
-        return JSONResponse({"value": None})
+def _select_all(adjusted: Dict[str, Any]) -> Dict[str, Any]:
+    return dict(adjusted)
+
 
+def _select_key(key: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _select(adjusted: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: adjusted.get(key, "KEY_NOT_FOUND")}
+    return _select
+
+
+# `type` query value -> payload builder; unknown types fall back to _select_key
+_PAYLOAD_SELECTORS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "all": _select_all,
+    **{k: _select_key(k) for k in ("pt", "tc", "lc", "fcv_actual", "fcv_expected")},
+}
+
+
+def _render_data(snap: Dict[str, Any], select: Callable[[Dict[str, Any]], Dict[str, Any]]) -> bytes:
     ts = snap.get("timestamp")
     adjusted = snap.get("adjusted") or snap.get("value") or {}
 
-    # Mirror Flask behavior: whole value dict, or a single key
-    if type != "all":
-        payload = {type: adjusted.get(type, "KEY_NOT_FOUND")}
-    else:
-        payload = dict(adjusted)
-
     env = DataEnvelope(
-        value=payload,
+        value=select(adjusted),
         timestamp=ts,
         raw=snap.get("raw"),
         adjusted=snap.get("adjusted"),
         offsets=snap.get("offsets"),
     )
-    return JSONResponse(env.model_dump())
+    payload = env.model_dump()
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return JSONResponse(payload).body
+
+
+@router.get("/data", name="data")
+def get_data(request: Request, type: str = "all"):
+    cache = request.app.state.cache
+
+    # Mirror Flask behavior: whole value dict, or a single key
+    select = _PAYLOAD_SELECTORS.get(type)
+    if select is not None:
+        # Known types are encoded once per snapshot and shared by all pollers
+        body = cache.get_rendered(type, lambda snap: _render_data(snap, select))
+    else:
+        snap = cache.get_full()
+        body = _render_data(snap, _select_key(type)) if snap else None
+    if body is None:
+        return JSONResponse({"value": None})
+    return Response(content=body, media_type="application/json")
+
+
+# Fixed-shape acknowledgement for browser pings; only the server time varies
+_OK_PREFIX = b'{"status":"ok","timestamp":'
+
+
+def _ok_response() -> Response:
+    return Response(content=_OK_PREFIX + repr(time.time()).encode() + b"}", media_type="application/json")
 
 
 @router.post("/api/browser_heartbeat")
 async def browser_heartbeat(request: Request):
     """Receive browser heartbeat to monitor user activity"""
-    try:
-        data = await request.json()
-        # Log or store heartbeat data if needed for monitoring
-        return JSONResponse({"status": "ok", "timestamp": time.time()})
-    except Exception:
-        return JSONResponse({"status": "ok", "timestamp": time.time()})
+    # The payload is not used yet, so it is not parsed
+    return _ok_response()
 
 
 @router.post("/api/browser_status") 
 async def browser_status(request: Request):
     """Receive browser status updates"""
-    try:
-        data = await request.json()
-        # Log or store status data if needed for monitoring
-        return JSONResponse({"status": "ok", "timestamp": time.time()})
-    except Exception:
-        return JSONResponse({"status": "ok", "timestamp": time.time()})
+    # The payload is not used yet, so it is not parsed
+    return _ok_response()
 
 
 @router.get("/api/serial/logs")
@@ -25,10 +25,12 @@ class CalibrationStore:
     path: Path
 
     def load(self) -> Dict[str, float]:
-        if not self.path.exists():
+        try:
+            f = self.path.open("r")
+        except FileNotFoundError:
             print("No offsets so i am returnnig an empty map lol good luck")
             return {}
-        with self.path.open("r") as f:
+        with f:
             data = yaml.safe_load(f) or {}
             if not isinstance(data, dict):
                 raise ValueError("calibration file must be a mapping of id -> float")
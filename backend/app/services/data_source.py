@@ -12,8 +12,21 @@ try:
 except Exception:  # pragma: no cover
     serial = None  # type: ignore
 
+try:
+    import orjson  # faster JSON decoding for incoming serial packets
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 from ..config.loader import Settings
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps_str(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
 
 class DataSource(Protocol):
     def initialize(self) -> None: ...
@@ -26,26 +39,66 @@ class SimulatorSource:
     settings: Settings
     update_interval_s: float = 0.1
 
+    def __post_init__(self) -> None:
+        # Sensor configs are fixed for the life of the source; resolve each
+        # sensor's value bands once instead of on every tick. GN2 PTs get
+        # None and follow the sine waveform instead.
+        self._pt_bands = [
+            None if str(ptc.get("name", "")).strip().upper() == "GN2"
+            else self._bands(float(ptc.get("min_value", 0.0)), float(ptc.get("max_value", 1000.0)))
+            for ptc in self.settings.PRESSURE_TRANSDUCERS
+        ]
+        self._tc_bands = [
+            self._bands(tcc.get("min_value", 0.0), tcc.get("max_value", 1000.0))
+            for tcc in self.settings.THERMOCOUPLES
+        ]
+        self._lc_bands = [
+            self._bands(lcc.get("min_value", 0.0), lcc.get("max_value", 1000.0))
+            for lcc in self.settings.LOAD_CELLS
+        ]
+        # Simulated valves never change state, so their lists (and the packet
+        # form) are built once; readings are treated as read-only downstream.
+        n_fcv = self.settings.NUM_FLOW_CONTROL_VALVES
+        self._fcv_actual: List[bool] = [False] * n_fcv
+        self._fcv_expected: List[bool] = [False] * n_fcv
+        self._fcv_packet: List[int] = [int(v) for v in self._fcv_actual]
+
     def initialize(self) -> None:
         # Anchor time for deterministic waveforms
         self._t0 = time.time()
         return None
 
-    def _rand_in_range(self, min_v: float, max_v: float) -> float:
+    @staticmethod
+    def _bands(min_v: float, max_v: float) -> Tuple[Tuple[float, float], ...]:
+        # (spike, elevated, normal) ranges sampled by _rand_in_bands, stored
+        # as (low, width) so a sample is a single multiply-add
+        return (
+            (max_v * 0.8, max_v * 0.95 - max_v * 0.8),
+            (max_v * 0.5, max_v * 0.7 - max_v * 0.5),
+            (min_v + max_v * 0.1, max_v * 0.4 - (min_v + max_v * 0.1)),
+        )
+
+    @staticmethod
+    def _rand_in_bands(bands: Tuple[Tuple[float, float], ...]) -> float:
+        # One draw picks the band (2% spike, 3% elevated, 95% normal); the
+        # draw's position within that slice is itself uniform, so rescaling
+        # it gives the value without a second RNG call
         r = random.random()
         if r < 0.02:
-            return random.uniform(max_v * 0.8, max_v * 0.95)
+            low, width = bands[0]
+            return low + width * (r / 0.02)
         if r < 0.05:
-            return random.uniform(max_v * 0.5, max_v * 0.7)
-        return random.uniform(min_v + max_v * 0.1, max_v * 0.4)
+            low, width = bands[1]
+            return low + width * ((r - 0.02) / 0.03)
+        low, width = bands[2]
+        return low + width * ((r - 0.05) / 0.95)
 
     def read_once(self) -> Tuple[Dict[str, Union[List[float], List[bool]]], float]:
         now = time.time()
         # Pressure transducers: special behavior for GN2 (sine wave + noise)
         pt: List[float] = []
-        for i, ptc in enumerate(self.settings.PRESSURE_TRANSDUCERS):
-            name = str(ptc.get("name", "")).strip().upper()
-            if name == "GN2":
+        for bands in self._pt_bands:
+            if bands is None:
                 # Sine with 60s period between -30 and 5000 plus noise
                 period = 25.0
                 t = (now - getattr(self, "_t0", now)) / period
@@ -59,27 +112,15 @@ class SimulatorSource:
                 val = max(min_v, min(max_v, val))
                 pt.append(val)
             else:
-                pt.append(
-                    self._rand_in_range(
-                        float(ptc.get("min_value", 0.0)), float(ptc.get("max_value", 1000.0))
-                    )
-                )
-        tc = [
-            self._rand_in_range(tcc.get("min_value", 0.0), tcc.get("max_value", 1000.0))
-            for tcc in self.settings.THERMOCOUPLES
-        ]
-        lc = [
-            self._rand_in_range(lcc.get("min_value", 0.0), lcc.get("max_value", 1000.0))
-            for lcc in self.settings.LOAD_CELLS
-        ]
-        fcv_actual = [False] * self.settings.NUM_FLOW_CONTROL_VALVES
-        fcv_expected = [False] * self.settings.NUM_FLOW_CONTROL_VALVES
-
+                pt.append(self._rand_in_bands(bands))
+        rand_in_bands = self._rand_in_bands
+        tc = [rand_in_bands(bands) for bands in self._tc_bands]
+        lc = [rand_in_bands(bands) for bands in self._lc_bands]
         value = {
             "tc": tc,
             "pt": pt,
-            "fcv_actual": fcv_actual,
-            "fcv_expected": fcv_expected,
+            "fcv_actual": self._fcv_actual,
+            "fcv_expected": self._fcv_expected,
             "lc": lc,
             "timestamp": now,
         }
@@ -88,10 +129,10 @@ class SimulatorSource:
         monitor = getattr(self.settings, '_serial_monitor_buffer', None)
         if monitor:
             # Format like a real flight computer JSON packet
-            packet = json.dumps({"value": {"pt": [round(v, 2) for v in pt],
-                                           "tc": [round(v, 2) for v in tc],
-                                           "lc": [round(v, 2) for v in lc],
-                                           "fcv": [int(v) for v in fcv_actual]}})
+            packet = _json_dumps_str({"value": {"pt": [round(v, 2) for v in pt],
+                                                "tc": [round(v, 2) for v in tc],
+                                                "lc": [round(v, 2) for v in lc],
+                                                "fcv": self._fcv_packet}})
             monitor.add_line(packet, source="simulator")
 
         return value, now
@@ -156,8 +197,11 @@ class SerialSource:
         if monitor and raw_line:
             monitor.add_line(raw_line, source="serial")
 
+        # Only JSON objects carry readings; skip debug/plain-text lines without invoking the decoder
+        if not raw_line.startswith('{'):
+            return
         try:
-            data = json.loads(raw_line)
+            data = _json_loads(raw_line)
         except Exception:
             return
         if not isinstance(data, dict) or 'value' not in data:
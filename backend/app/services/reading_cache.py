@@ -1,30 +1,54 @@
 from __future__ import annotations
 
-import threading
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 
 class LatestReadingCache:
-    """Thread-safe snapshot of latest reading."""
+    """Thread-safe snapshot of latest reading.
+
+    Writers publish by replacing a single (snapshot, rendered) slot; a
+    reference assignment is atomic, so readers never take a lock. A
+    published snapshot is never mutated, and its rendered views live in a
+    dict that belongs to that snapshot alone.
+    """
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._snapshot: Optional[Dict[str, Any]] = None
+        self._slot: Tuple[Optional[Dict[str, Any]], Dict[str, bytes]] = (None, {})
 
     def set(self, value: Dict[str, Any], timestamp: float) -> None:
-        with self._lock:
-            self._snapshot = {"value": dict(value), "timestamp": float(timestamp)}
+        self._slot = ({"value": dict(value), "timestamp": float(timestamp)}, {})
 
     def get(self) -> Tuple[Optional[Dict[str, Any]], Optional[float]]:
-        with self._lock:
-            if self._snapshot is None:
-                return None, None
-            return dict(self._snapshot["value"]), self._snapshot["timestamp"]
+        snap = self._slot[0]
+        if snap is None:
+            return None, None
+        ts = snap.get("timestamp")
+        value = snap.get("value")
+        if value is None:
+            # Full snapshots don't store the legacy 'value' view; derive it on
+            # demand (adjusted readings with the timestamp folded in)
+            value = dict(snap.get("adjusted") or {})
+            value["timestamp"] = ts
+        return dict(value), ts
 
     def set_full(self, snapshot: Dict[str, Any]) -> None:
-        with self._lock:
-            self._snapshot = dict(snapshot)
+        self._slot = (dict(snapshot), {})
 
     def get_full(self) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            return None if self._snapshot is None else dict(self._snapshot)
+        snap = self._slot[0]
+        return None if snap is None else dict(snap)
+
+    def get_rendered(self, key: str, render: Callable[[Dict[str, Any]], bytes]) -> Optional[bytes]:
+        """Return render(snapshot) for the current snapshot, memoized by key.
+
+        If the snapshot is replaced while rendering, the result is memoized
+        on the old snapshot's views only and is never served for the new one.
+        """
+        snap, rendered = self._slot
+        if snap is None:
+            return None
+        body = rendered.get(key)
+        if body is None:
+            body = render(dict(snap))
+            rendered[key] = body
+        return body
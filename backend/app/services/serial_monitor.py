@@ -6,8 +6,7 @@ Captures every raw data packet from both serial and simulator sources.
 import time
 import threading
 from collections import deque
-from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 
 
 class SerialMonitorBuffer:
@@ -17,6 +16,17 @@ class SerialMonitorBuffer:
         self._lines: deque = deque(maxlen=maxlen)
         self._index: int = 0  # Global monotonic index
         self._lock = threading.Lock()
+        # (whole second, "HH:MM:SS.") for the last formatted timestamp
+        self._ts_prefix: Tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, now: float) -> str:
+        """Format local HH:MM:SS.mmm, reformatting the seconds part only when it changes."""
+        sec = int(now)
+        cached_sec, prefix = self._ts_prefix
+        if sec != cached_sec:
+            prefix = time.strftime("%H:%M:%S.", time.localtime(sec))
+            self._ts_prefix = (sec, prefix)
+        return f"{prefix}{int((now - sec) * 1000):03d}"
 
     def add_line(self, raw_data: str, source: str = "serial") -> None:
         """Add a raw data line to the buffer.
@@ -25,9 +35,7 @@ class SerialMonitorBuffer:
             raw_data: The raw string as received from serial / generated by simulator.
             source: 'serial' or 'simulator' to indicate origin.
         """
-        now = time.time()
-        dt = datetime.fromtimestamp(now)
-        timestamp_str = dt.strftime("%H:%M:%S.") + f"{dt.microsecond // 1000:03d}"
+        timestamp_str = self._format_timestamp(time.time())
 
         with self._lock:
             self._lines.append({
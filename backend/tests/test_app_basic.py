@@ -1,3 +1,4 @@
+import pytest
 from fastapi.testclient import TestClient
 
 
@@ -12,39 +13,56 @@ def get_client():
     return TestClient(app)
 
 
-def test_healthz_200():
-    with get_client() as client:
-        r = client.get("/healthz")
-        assert r.status_code == 200
-        body = r.json()
-        assert body.get("healthy") is True
+@pytest.fixture(scope="module")
+def client():
+    # One app lifespan for the module; each startup spins up the reader and monitor threads
+    with get_client() as c:
+        yield c
 
 
-def test_pages_200():
-    with get_client() as client:
-        for path in ("/", "/pressure", "/thermocouples", "/valves"):
-            r = client.get(path)
-            assert r.status_code == 200
+def test_healthz_200(client):
+    r = client.get("/healthz")
+    assert r.status_code == 200
+    body = r.json()
+    assert body.get("healthy") is True
 
 
-def test_data_endpoint_shape():
-    with get_client() as client:
-        r = client.get("/data")
+def test_pages_200(client):
+    for path in ("/", "/pressure", "/thermocouples", "/valves"):
+        r = client.get(path)
         assert r.status_code == 200
-        body = r.json()
-        assert "value" in body
-        assert "timestamp" in body
-        v = body["value"]
-        assert isinstance(v, dict)
-        # Expect legacy keys
-        for k in ("pt", "tc", "lc", "fcv_actual", "fcv_expected"):
-            assert k in v
-
-
-def test_data_type_filtering():
-    with get_client() as client:
-        r = client.get("/data?type=pt")
+
+
+def test_data_endpoint_shape(client):
+    r = client.get("/data")
+    assert r.status_code == 200
+    body = r.json()
+    assert "value" in body
+    assert "timestamp" in body
+    v = body["value"]
+    assert isinstance(v, dict)
+    # Expect legacy keys
+    for k in ("pt", "tc", "lc", "fcv_actual", "fcv_expected"):
+        assert k in v
+
+
+def test_data_type_filtering(client):
+    r = client.get("/data?type=pt")
+    assert r.status_code == 200
+    body = r.json()
+    assert set(body["value"].keys()) == {"pt"}
+
+
+def test_data_unknown_type(client):
+    r = client.get("/data?type=bogus")
+    assert r.status_code == 200
+    assert r.json()["value"] == {"bogus": "KEY_NOT_FOUND"}
+
+
+def test_browser_heartbeat_ack(client):
+    for path in ("/api/browser_heartbeat", "/api/browser_status"):
+        r = client.post(path, json={"timestamp": 0})
         assert r.status_code == 200
         body = r.json()
-        assert set(body["value"].keys()) == {"pt"}
-
+        assert body["status"] == "ok"
+        assert isinstance(body["timestamp"], float)
@@ -0,0 +1,67 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.logging import LoggerManager
+from backend.app.logging import error_recovery
+from backend.app.logging.error_recovery import ErrorType
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Cooldowns run on time.monotonic(); drive it by hand
+    now = [100.0]
+    monkeypatch.setattr(error_recovery, 'time', SimpleNamespace(time=time.time, monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def recovery(tmp_path, clock):
+    mgr = LoggerManager(tmp_path)
+    yield error_recovery.ErrorRecovery(mgr)
+    mgr.close()
+
+
+def test_attempt_limit_cooldown_and_escalation(recovery, clock):
+    calls, escalations = [], []
+    recovery.register_recovery_action(
+        ErrorType.DATA_STALE, 'retry', lambda context: calls.append(clock[0]) or False,
+        max_attempts=2, cooldown_seconds=10,
+        escalation_func=lambda error_type, message: escalations.append(clock[0]),
+    )
+
+    def attempt(at):
+        clock[0] = at
+        asyncio.run(recovery.handle_error(ErrorType.DATA_STALE, 'stale'))
+
+    attempt(100.0)  # first attempt fails, below max_attempts: no escalation
+    attempt(105.0)  # inside the cooldown: blocked
+    attempt(111.0)  # second failure reaches max_attempts: escalates
+    attempt(115.0)  # blocked again
+    assert calls == [100.0, 111.0]
+    assert escalations == [111.0]
+    assert len(recovery.recovery_attempts[ErrorType.DATA_STALE]) == 2
+
+    # After the cooldown the history starts over, so the next failure doesn't escalate
+    attempt(121.0)
+    assert calls == [100.0, 111.0, 121.0]
+    assert escalations == [111.0]
+    assert list(recovery.recovery_attempts[ErrorType.DATA_STALE]) == [121.0]
+    by_type = recovery.get_recovery_stats()['by_error_type'][ErrorType.DATA_STALE.value]
+    assert (by_type['attempts'], by_type['total_attempts']) == (1, 3)
+
+
+def test_reregistering_an_action_resets_its_history(recovery):
+    recovery.register_recovery_action(ErrorType.DATA_STALE, 'retry', lambda context: False,
+                                      max_attempts=2, cooldown_seconds=10)
+    asyncio.run(recovery.handle_error(ErrorType.DATA_STALE, 'stale'))
+    assert len(recovery.recovery_attempts[ErrorType.DATA_STALE]) == 1
+
+    recovery.register_recovery_action(ErrorType.DATA_STALE, 'retry', lambda context: True,
+                                      max_attempts=4, cooldown_seconds=10)
+    attempts = recovery.recovery_attempts[ErrorType.DATA_STALE]
+    assert len(attempts) == 0 and attempts.maxlen == 4
+    # With the history gone the cooldown no longer applies either
+    assert asyncio.run(recovery.handle_error(ErrorType.DATA_STALE, 'stale')) is True
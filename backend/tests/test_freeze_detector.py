@@ -0,0 +1,60 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.logging import LoggerManager
+from backend.app.logging import freeze_detector
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Drive the detector's wall clock by hand; the monitor thread is never started
+    now = [1000.0]
+    monkeypatch.setattr(freeze_detector, 'time', SimpleNamespace(time=lambda: now[0], monotonic=time.monotonic))
+    return now
+
+
+@pytest.fixture
+def detector(tmp_path, clock):
+    mgr = LoggerManager(tmp_path)
+    detector = freeze_detector.FreezeDetector(mgr, autostart=False)
+    for name in list(detector.watchdogs):
+        detector.set_watchdog_active(name, False)
+    yield detector
+    mgr.close()
+
+
+def test_repeat_freeze_alerts_back_off_until_heartbeat(detector, clock):
+    alerts = []
+    detector.register_watchdog('probe', 1.0, callback=lambda component, duration: alerts.append(clock[0]))
+
+    def run_until(t):
+        while clock[0] < t:
+            clock[0] = round(clock[0] + 0.1, 6)
+            detector._check_all_watchdogs()
+
+    run_until(1016.0)
+    gaps = [b - a for a, b in zip(alerts, alerts[1:])]
+    assert alerts[0] == pytest.approx(1001.1)
+    assert gaps == pytest.approx([2.0, 4.0, 8.0], abs=0.15)
+
+    # A heartbeat resets the backoff: the next freeze alerts after one timeout
+    detector.heartbeat('probe')
+    run_until(1018.0)
+    assert alerts[-1] == pytest.approx(1017.1)
+
+
+def test_cached_stats_are_copies(detector):
+    detector.register_watchdog('probe', 1.0)
+
+    stats = detector.get_stats()
+    stats['freezes_detected'] = -1
+    stats['watchdog_status']['probe']['healthy'] = None
+    health = detector.health_check()
+    health['triggered_watchdogs'].append('bogus')
+
+    again = detector.get_stats()
+    assert again['freezes_detected'] == 0
+    assert again['watchdog_status']['probe']['healthy'] is True
+    assert detector.health_check()['triggered_watchdogs'] == []
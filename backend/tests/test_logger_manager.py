@@ -0,0 +1,112 @@
+import csv
+import io
+import json
+import logging
+import os
+import threading
+from types import SimpleNamespace
+
+from backend.app.logging import LoggerManager
+
+
+def test_queued_writes_flushed_on_close(tmp_path):
+    mgr = LoggerManager(tmp_path)
+    for i in range(10):
+        mgr.log_event('test', f'event {i}', {'i': i})
+    mgr.log_error('test_error', 'boom', ValueError('bad'))
+    mgr.close()
+
+    events = [json.loads(line) for line in mgr.events_log.read_text().splitlines()]
+    assert [e['data']['i'] for e in events] == list(range(10))
+    errors = [json.loads(line) for line in mgr.errors_log.read_text().splitlines()]
+    assert errors[0]['exception_type'] == 'ValueError'
+
+    # Writes after close still land on disk
+    mgr.log_event('test', 'late')
+    assert 'late' in mgr.events_log.read_text()
+
+
+def test_bounded_queue_counts_dropped_writes(tmp_path):
+    mgr = LoggerManager(tmp_path, max_queued_writes=2)
+    mgr._flush_threshold = 1
+    writing, release = threading.Event(), threading.Event()
+    write_batch = mgr._write_batch
+
+    def stalled_write_batch(batch, handles=None):
+        writing.set()
+        release.wait(5)
+        write_batch(batch, handles)
+
+    mgr._write_batch = stalled_write_batch
+    mgr.log_event('test', 'first')
+    assert writing.wait(5)
+    # The writer is stuck on the first record: two fit in the queue, three are dropped
+    for i in range(5):
+        mgr.log_event('test', f'event {i}')
+    release.set()
+    mgr.close()
+
+    assert mgr.stats['dropped_writes'] == 3
+    assert len(mgr.events_log.read_text().splitlines()) == 3
+
+
+def test_write_errors_counted_per_file(tmp_path):
+    mgr = LoggerManager(tmp_path)
+    missing = tmp_path / 'no_such_dir' / 'data.jsonl'
+    mgr.append_record(missing, {'ts': 1})
+    mgr.log_event('test', 'ok')
+    mgr.close()
+
+    assert mgr.write_errors_for(missing) == 1
+    assert mgr.write_errors_for(mgr.data_log, mgr.events_log) == 0
+
+
+def test_csv_rows_match_csv_writer(tmp_path):
+    mgr = LoggerManager(tmp_path)
+    settings = SimpleNamespace(
+        PRESSURE_TRANSDUCERS=[{'id': 'pt1'}], THERMOCOUPLES=[{'id': 'tc1'}],
+        LOAD_CELLS=[], FLOW_CONTROL_VALVES=[{'id': 'fcv1'}],
+    )
+    rows = [
+        {'pt': [1.5], 'tc': [None], 'fcv_actual': [True], 'fcv_expected': [False]},
+        {'pt': ['a,b'], 'tc': ['say "hi"'], 'fcv_actual': ['two\nlines'], 'fcv_expected': ['cr\r']},
+    ]
+    offsets = {'pt1': 0.25, 'tc1': 0}
+    for i, raw in enumerate(rows):
+        mgr.log_data_csv(100.0 + i, raw, raw, offsets, settings)
+    mgr.close()
+
+    content = mgr.data_csv_log.read_bytes().decode()
+    parsed = list(csv.reader(io.StringIO(content, newline='')))
+    assert len(parsed) == 3
+
+    # Rebuild the file with csv.writer, taking logged_at (wall clock) from what was written
+    buf = io.StringIO(newline='')
+    writer = csv.writer(buf)
+    writer.writerow(parsed[0])
+    for i, (raw, row) in enumerate(zip(rows, parsed[1:])):
+        ts = 100.0 + i
+        values = [v for arr in raw.values() for v in arr]
+        writer.writerow([ts, ts - mgr.stats['start_time'], *values, *values, *offsets.values(), float(row[-1])])
+    assert content == buf.getvalue()
+
+
+def test_foreign_root_handlers_left_in_place(tmp_path):
+    root = logging.getLogger()
+    foreign = logging.NullHandler()
+    root.addHandler(foreign)
+    try:
+        mgr = LoggerManager(tmp_path)
+        assert foreign in root.handlers
+        mgr.close()
+        assert root.handlers.count(foreign) == 1
+    finally:
+        root.removeHandler(foreign)
+
+
+def test_latest_symlink_replaces_stale_temp_link(tmp_path):
+    os.symlink('gone', tmp_path / f'.latest.{os.getpid()}.tmp')
+    mgr = LoggerManager(tmp_path)
+    mgr.close()
+    assert os.readlink(tmp_path / 'latest') == mgr.run_timestamp
+    assert not os.path.lexists(tmp_path / f'.latest.{os.getpid()}.tmp')
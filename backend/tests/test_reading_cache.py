@@ -0,0 +1,52 @@
+import json
+
+from backend.app.services.reading_cache import LatestReadingCache
+from backend.app.routers import data
+from backend.app.schemas.data import DataEnvelope
+
+
+def make_snapshot(scale):
+    adjusted = {
+        "pt": [1.5 * scale, 2.0], "tc": [20.25 * scale], "lc": [0.0],
+        "fcv_actual": [True], "fcv_expected": [False],
+    }
+    return {
+        "raw": {k: list(v) for k, v in adjusted.items()},
+        "adjusted": adjusted,
+        "offsets": {"pt1": 0.5},
+        "timestamp": 1700000000.0 + scale,
+    }
+
+
+def test_rendered_data_matches_envelope_and_follows_snapshots():
+    cache = LatestReadingCache()
+    renders = []
+
+    def rendered(type_):
+        select = data._PAYLOAD_SELECTORS[type_]
+
+        def render(snap):
+            renders.append(type_)
+            return data._render_data(snap, select)
+        return cache.get_rendered(type_, render)
+
+    assert rendered("all") is None
+
+    for scale in (1, 2):
+        snapshot = make_snapshot(scale)
+        cache.set_full(snapshot)
+        renders.clear()
+        for type_, select in data._PAYLOAD_SELECTORS.items():
+            body = rendered(type_)
+            expected = DataEnvelope(
+                value=select(snapshot["adjusted"]),
+                timestamp=snapshot["timestamp"],
+                raw=snapshot["raw"],
+                adjusted=snapshot["adjusted"],
+                offsets=snapshot["offsets"],
+            ).model_dump_json()
+            assert json.loads(body) == json.loads(expected)
+            # Memoized: a second read of the same snapshot reuses the bytes
+            assert rendered(type_) is body
+        # Each selector rendered exactly once per snapshot
+        assert sorted(renders) == sorted(data._PAYLOAD_SELECTORS)